@@ -3,27 +3,556 @@ Argument Structure Analyzer - Streamlit Web App
 GUI für interaktive Argument-Analyse
 """
 
+import html
+import json
 import streamlit as st
-import pandas as pd
+import numpy as np
 from pathlib import Path
 import sys
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional C JSON encoder for the export (falls back to the stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from preprocessing import TextPreprocessor
-from claim_detection import ClaimDetector
-from emotion_analysis import EmotionAnalyzer
-from argument_classification import ArgumentClassifier
-from structure_builder import StructureBuilder
+# Analyzer modules, pandas and Plotly are imported where they are first
+# needed, so the first page load does not wait for them
 from test_cases import list_test_cases, get_test_case
+from numeric_kernels import filter_mask, group_means, group_stats, type_summary, warmup
 
 # translation support
 from translations import LANGUAGE_NAMES, t
 
+
+# Argument types in display order; the index is the type code used in the
+# columnar arrays of the analysis results
+ARG_TYPES = ("CLAIM", "SUPPORT", "COUNTER", "NEUTRAL")
+TYPE_CODES = {arg_type: code for code, arg_type in enumerate(ARG_TYPES)}
+ARG_ICONS = {"CLAIM": "🟢", "SUPPORT": "🔵", "COUNTER": "🟣", "NEUTRAL": "⚪"}
+ARG_ICONS_BY_CODE = tuple(ARG_ICONS[arg_type] for arg_type in ARG_TYPES)
+
+# Chart colors, keyed like the data they color
+ARG_COLORS = {"CLAIM": "#00cc96", "SUPPORT": "#636EFA", "COUNTER": "#ab63fa", "NEUTRAL": "#cccccc"}
+ARG_COLORS_BY_CODE = tuple(ARG_COLORS[arg_type] for arg_type in ARG_TYPES)
+SENTIMENT_COLORS = {"positive": "#00cc96", "neutral": "#636EFA", "negative": "#ef553b"}
+SUMMARY_SENTIMENT_COLORS = {sentiment.capitalize(): color for sentiment, color in SENTIMENT_COLORS.items()}
+
+# App stylesheet, injected via load_css()
+CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
+# Flat, picklable summaries read by the overview and sentiment metrics
+Overview = namedtuple("Overview", "claims supports counters avg_strength")
+SentimentOverview = namedtuple("SentimentOverview", "positive neutral negative avg_sentiment avg_emotionality")
+
+# Bounds for the memoized analysis pipeline (seconds / distinct texts)
+PIPELINE_CACHE_TTL = 24 * 60 * 60
+PIPELINE_CACHE_ENTRIES = 64
+
+# Per-sentence analysis results kept across analyses (distinct sentences)
+SENTENCE_CACHE_ENTRIES = 10000
+
+# Built Plotly figures are memoized on their (small) inputs
+FIGURE_CACHE_ENTRIES = 16
+
+# Scatter plots above this size show a fixed random sample of the points
+SCATTER_MAX_POINTS = 500
+
+# Details table: fractions are shown as percentages, formatted client-side
+# (printf-style formats cannot scale, so the displayed columns are x100)
+PERCENT_COLUMNS = ("Confidence", "Strength", "Emotionality")
+DETAIL_COLUMN_CONFIG = {column: st.column_config.NumberColumn(format="%.0f%%") for column in PERCENT_COLUMNS}
+
+# Characters of the JSON export shown inline; the full file is a download
+EXPORT_PREVIEW_CHARS = 2000
+
+
+@st.cache_data(show_spinner=False)
+def load_css() -> str:
+    """
+    App stylesheet as a <style> element, read from disk once. Streamlit
+    rebuilds the page on every rerun, so the element is still emitted each
+    time, but with an identical payload. Falls back to the default theme
+    (empty stylesheet) when the file is missing, e.g. in a wheel install
+    that only ships the modules.
+    """
+    try:
+        css = CSS_PATH.read_text(encoding='utf-8')
+    except OSError:
+        css = ""
+    return f"<style>\n{css}</style>"
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_kernels() -> bool:
+    """Compiles the numeric kernels once per process, before the first analysis"""
+    warmup()
+    return True
+
+
+# Analyzer components are stateless after construction, so one instance per
+# process is shared across reruns and sessions. StructureBuilder keeps the
+# tree of the last build and is therefore created per analysis.
+@st.cache_resource(show_spinner=False)
+def get_preprocessor():
+    """Shared TextPreprocessor (loads the spaCy model once, same instance as the CLI)"""
+    from preprocessing import TextPreprocessor
+    return TextPreprocessor.instance()
+
+
+@st.cache_resource(show_spinner=False)
+def get_preprocessor_lock() -> threading.Lock:
+    """
+    Serializes calls into the shared spaCy pipeline, which is not documented
+    as thread-safe; sessions run on separate script threads. The classifier
+    and emotion analyzer only read their lexicons and need no lock.
+    """
+    return threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def get_classifier():
+    """Shared ArgumentClassifier"""
+    from argument_classification import ArgumentClassifier
+    return ArgumentClassifier()
+
+
+@st.cache_resource(show_spinner=False)
+def get_emotion_analyzer():
+    """Shared EmotionAnalyzer (the same instance the classifier uses)"""
+    from emotion_analysis import EmotionAnalyzer
+    return EmotionAnalyzer.instance()
+
+
+@st.cache_resource(show_spinner=False)
+def get_sentence_cache() -> tuple:
+    """
+    LRU map sentence text -> (classification, emotion result), shared by all
+    sessions together with the lock that guards it. Both analyses are
+    per-sentence and context-free, so cached entries stay valid.
+    """
+    return OrderedDict(), threading.Lock()
+
+
+def analyze_sentences(classifier, sentences) -> tuple:
+    """
+    Classifications and emotion results for all sentences; only sentences
+    not seen in earlier analyses go through the classifier
+    """
+    cache, lock = get_sentence_cache()
+    with lock:
+        cached = [cache.get(sent.text) for sent in sentences]
+    missing = [sent for sent, hit in zip(sentences, cached) if hit is None]
+    fresh = iter(zip(*classifier.analyze_batch(missing)))
+    
+    pairs = [hit if hit is not None else next(fresh) for hit in cached]
+    with lock:
+        for sent, pair in zip(sentences, pairs):
+            cache[sent.text] = pair
+            cache.move_to_end(sent.text)
+        while len(cache) > SENTENCE_CACHE_ENTRIES:
+            cache.popitem(last=False)
+    
+    return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup() -> list:
+    """
+    Builds the shared analyzers and compiles the kernels on a background
+    pool once per process, so first paint does not wait for them and they
+    are usually ready by the time Analyze is clicked
+    """
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="warmup")
+    futures = [executor.submit(factory) for factory in (get_preprocessor, get_classifier, get_emotion_analyzer, warm_up_kernels)]
+    executor.shutdown(wait=False)
+    return futures
+
+
+def wait_for_warmup():
+    """
+    Blocks until the background warm-up is done; re-raises its errors and
+    drops the cached futures, so the next run retries instead of failing
+    with the same stored exception
+    """
+    try:
+        for future in start_warmup():
+            future.result()
+    except Exception:
+        start_warmup.clear()
+        raise
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def text_stats(text: str) -> tuple:
+    """Character count, word count and estimated sentence count of a text"""
+    # Sentence estimate: terminal punctuation, as split by the fallback tokenizer
+    sentences = text.count(".") + text.count("!") + text.count("?")
+    return len(text), len(text.split()), max(1, sentences)
+
+
+@st.cache_data(show_spinner=False)
+def sentiment_frame(positive: int, neutral: int, negative: int):
+    """Small column-built DataFrame for the sentiment bar chart"""
+    import pandas as pd
+    return pd.DataFrame({
+        "Sentiment": ["Positive", "Neutral", "Negative"],
+        "Count": np.array([positive, neutral, negative], dtype=np.int32)
+    })
+
+
+# Figure builders: each takes only the data its chart needs, so reruns and
+# tab switches return the memoized figure instead of rebuilding traces
+figure_cache = st.cache_data(show_spinner=False, ttl=PIPELINE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+
+
+@figure_cache
+def sentiment_summary_figure(positive: int, neutral: int, negative: int):
+    """Bar chart of the sentiment summary (Sentiment tab)"""
+    import plotly.express as px
+    fig = px.bar(
+        sentiment_frame(positive, neutral, negative),
+        x='Sentiment',
+        y='Count',
+        color='Sentiment',
+        color_discrete_map=SUMMARY_SENTIMENT_COLORS
+    )
+    fig.update_layout(
+        height=350,
+        showlegend=False,
+        xaxis_title="",
+        yaxis_title="Count",
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def type_pie_figure(type_counts: tuple):
+    """Pie chart of the argument types; type_counts is ordered like ARG_TYPES"""
+    import plotly.graph_objects as go
+    present = [code for code, count in enumerate(type_counts) if count > 0]
+    fig = go.Figure(data=[go.Pie(
+        labels=[ARG_TYPES[code] for code in present],
+        values=[type_counts[code] for code in present],
+        marker=dict(colors=[ARG_COLORS_BY_CODE[code] for code in present]),
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
+    )])
+    fig.update_layout(
+        height=350,
+        showlegend=True,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def strength_box_figure(frame):
+    """Box plot of the strength per argument type"""
+    import plotly.express as px
+    fig = px.box(
+        frame,
+        x='Type',
+        y='Strength',
+        color='Type',
+        color_discrete_map=ARG_COLORS,
+        points='outliers'
+    )
+    fig.update_layout(
+        height=350,
+        showlegend=False,
+        xaxis_title="",
+        yaxis_title="Strength Score",
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def confidence_scatter_figure(frame):
+    """Confidence vs. strength scatter, sized by emotionality"""
+    import plotly.express as px
+    fig = px.scatter(
+        frame,
+        x='Confidence',
+        y='Strength',
+        color='Type',
+        size='Emotionality',
+        hover_data=['Text', 'Sentiment'],
+        color_discrete_map=ARG_COLORS
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title="Confidence Score",
+        yaxis_title="Argument Strength",
+        hovermode='closest',
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def sentiment_counts_figure(labels: tuple, counts: tuple):
+    """Bar chart of the per-argument sentiment counts"""
+    import plotly.express as px
+    fig = px.bar(
+        x=list(labels),
+        y=list(counts),
+        labels={'x': 'Sentiment', 'y': 'Count'},
+        color=list(labels),
+        color_discrete_map=SENTIMENT_COLORS
+    )
+    fig.update_layout(
+        height=350,
+        showlegend=False,
+        xaxis_title="",
+        yaxis_title="Count",
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def emotionality_histogram_figure(emotionality: np.ndarray):
+    """Histogram of the emotionality scores"""
+    import plotly.express as px
+    fig = px.histogram(
+        x=emotionality,
+        nbins=15,
+        color_discrete_sequence=['#ab63fa']
+    )
+    fig.update_layout(
+        height=350,
+        showlegend=False,
+        xaxis_title="Emotionality Score",
+        yaxis_title="Frequency",
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+@figure_cache
+def type_radar_figure(type_counts: tuple, type_means: np.ndarray):
+    """Radar of the mean metrics per occurring argument type"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for code, count in enumerate(type_counts):
+        if count > 0:
+            fig.add_trace(go.Scatterpolar(
+                r=type_means[code],
+                theta=['Confidence', 'Strength', 'Emotionality'],
+                fill='toself',
+                name=ARG_TYPES[code]
+            ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 1])),
+        height=450,
+        showlegend=True,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+def build_analysis_frame(classifications, confidence: np.ndarray, strength: np.ndarray, emotionality: np.ndarray):
+    """
+    One per-argument DataFrame shared by the Details and Visualizations tabs.
+    Texts are stored in full; each tab truncates them for its own display.
+    """
+    import pandas as pd
+    return pd.DataFrame({
+        "Type": pd.Categorical([cls.argument_type for cls in classifications], categories=ARG_TYPES),
+        "Text": [cls.sentence_text for cls in classifications],
+        "Confidence": confidence.astype(np.float32),
+        "Strength": strength.astype(np.float32),
+        "Sentiment": [cls.sentiment for cls in classifications],
+        "Emotionality": emotionality.astype(np.float32)
+    })
+
+
+def build_summary_frame(type_codes: np.ndarray, type_counts: np.ndarray, metrics: dict):
+    """
+    Summary statistics table (mean/min/max/std per metric) for the argument
+    types that occur, from one kernel pass per metric instead of groupby.agg
+    """
+    import pandas as pd
+    present = np.flatnonzero(type_counts)
+    stats = np.stack([group_stats(type_codes, values, len(ARG_TYPES)) for values in metrics.values()], axis=1)
+    return pd.DataFrame(
+        stats[present].reshape(present.size, -1).round(3),
+        index=pd.Index([ARG_TYPES[code] for code in present], name="Type"),
+        columns=pd.MultiIndex.from_product([list(metrics), ["mean", "min", "max", "std"]])
+    )
+
+
+def truncate_texts(texts, width: int):
+    """Shortens a text Series to width characters, marking cut texts with '...'"""
+    return texts.where(texts.str.len() <= width, texts.str.slice(0, width) + "...")
+
+
+def _export_row(cls) -> dict:
+    """JSON export entry of one classification"""
+    return {
+        "type": cls.argument_type,
+        "text": cls.sentence_text,
+        "confidence": cls.confidence,
+        "strength": cls.strength,
+        "sentiment": cls.sentiment,
+        "emotionality": cls.emotionality
+    }
+
+
+def _dump_json(obj) -> str:
+    """Compact, non-ASCII-escaping JSON encoding (orjson if available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_export_json(classifications, avg_strength: float) -> str:
+    """
+    Serializes the analysis export. Rows are encoded one at a time (one per
+    line) instead of first materializing the full list of row dicts.
+    """
+    metadata = _dump_json({
+        "total_sentences": len(classifications),
+        "avg_strength": avg_strength
+    })
+    rows = ",\n".join(_dump_json(_export_row(cls)) for cls in classifications)
+    return f'{{"metadata":{metadata},\n"arguments":[\n{rows}\n]}}'
+
+
+@st.cache_data(show_spinner=False, ttl=PIPELINE_CACHE_TTL, max_entries=PIPELINE_CACHE_ENTRIES)
+def run_pipeline(text: str) -> dict:
+    """
+    Runs the full analysis for a text, memoized on the text itself.
+    Widget changes rerun the script but hit this cache instead of the NLP.
+    Results are plain picklable data (no live builder object).
+    """
+    from structure_builder import StructureBuilder
+
+    processor = get_preprocessor()
+    classifier = get_classifier()
+    emotion_analyzer = get_emotion_analyzer()
+    builder = StructureBuilder()
+
+    # Process
+    with get_preprocessor_lock():
+        sentences = processor.process_text(text)
+    # One pass over the new sentences feeds both the claim and the emotion
+    # analysis; sentences from earlier analyses come from the sentence cache
+    classifications, emotions = analyze_sentences(classifier, sentences)
+    builder.build_structure(classifications)
+
+    # Columnar copies of the numeric fields for vectorized filtering/summaries;
+    # the builder already holds type codes (same order as ARG_TYPES) and strengths
+    n = len(classifications)
+    type_codes = builder.type_codes
+    strength = builder.strengths
+    confidence = np.fromiter((c.confidence for c in classifications), dtype=np.float64, count=n)
+    emotionality = np.fromiter((c.emotionality for c in classifications), dtype=np.float64, count=n)
+    type_counts, strength_sums = type_summary(type_codes, strength, len(ARG_TYPES))
+    type_avg_strength = strength_sums / np.maximum(type_counts, 1)
+
+    claim_avg_strength = float(type_avg_strength[TYPE_CODES["CLAIM"]])
+    weaknesses = classifier.get_logical_weaknesses_batch(classifications)
+    export_json = build_export_json(classifications, claim_avg_strength)
+    sentiment = emotion_analyzer.get_sentiment_summary(emotions)
+
+    return {
+        'sentences': sentences,
+        'classifications': classifications,
+        'tree_ascii': builder.visualize_ascii(),
+        'tree_stats': builder.get_tree_stats(),
+        'type_codes': type_codes,
+        'confidence': confidence,
+        'strength': strength,
+        'type_counts': type_counts,
+        'type_avg_strength': type_avg_strength,
+        'export_json': export_json,
+        'type_means': group_means(type_codes, confidence, strength, emotionality, len(ARG_TYPES)),
+        'analysis_frame': build_analysis_frame(classifications, confidence, strength, emotionality),
+        'summary_frame': build_summary_frame(type_codes, type_counts, {
+            "Confidence": confidence, "Strength": strength, "Emotionality": emotionality
+        }),
+        'weaknesses': weaknesses,
+        'weak_indices': [idx for idx, feedback in enumerate(weaknesses) if feedback],
+        'argument_summary': classifier.get_argument_summary(classifications),
+        'overview': Overview(
+            claims=int(type_counts[TYPE_CODES["CLAIM"]]),
+            supports=int(type_counts[TYPE_CODES["SUPPORT"]]),
+            counters=int(type_counts[TYPE_CODES["COUNTER"]]),
+            avg_strength=claim_avg_strength
+        ),
+        'emotions': emotions,
+        'emotion_summary': SentimentOverview(
+            positive=sentiment['positive'],
+            neutral=sentiment['neutral'],
+            negative=sentiment['negative'],
+            avg_sentiment=sentiment['avg_sentiment'],
+            # Empty analyses report no avg_emotionality
+            avg_emotionality=sentiment.get('avg_emotionality', 0.0)
+        )
+    }
+
+
+# Scoped reruns: changing the type filter reruns only this function, not the
+# whole script (st.fragment since Streamlit 1.37, experimental before)
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+
+@fragment
+def render_arguments(results: dict, min_confidence: float, lang_code: str):
+    """Arguments tab: type filter and the filtered argument cards"""
+    st.subheader(t(lang_code, "classified_args_header"))
+    
+    # Filter by type
+    arg_filter = st.multiselect(
+        "Filter by type:",
+        ["CLAIM", "SUPPORT", "COUNTER", "NEUTRAL"],
+        default=["CLAIM", "SUPPORT", "COUNTER"]
+    )
+    
+    allowed = np.zeros(len(ARG_TYPES), dtype=np.bool_)
+    allowed[[TYPE_CODES[arg_type] for arg_type in arg_filter]] = True
+    mask = filter_mask(results['type_codes'], results['confidence'], allowed, min_confidence)
+    
+    # Render all cards as one HTML element instead of ~10 widgets per argument
+    classifications = results['classifications']
+    type_codes = results['type_codes']
+    cards = []
+    for idx in np.flatnonzero(mask):
+        cls = classifications[idx]
+        icon = ARG_ICONS_BY_CODE[type_codes[idx]]
+        # Sentences may span lines; a blank line would end the markdown HTML
+        # block, so whitespace runs collapse to single spaces as HTML shows them
+        text = " ".join(html.escape(cls.sentence_text).split())
+        
+        cards.append(
+            f'<div class="argument-card">'
+            f'<div class="argument-icon">{icon}</div>'
+            f'<div class="argument-body">'
+            f'<p><strong>[{idx + 1}] {cls.argument_type}</strong></p>'
+            f'<p>{text}</p>'
+            f'<div class="argument-metrics">'
+            f'<span title="Confidence">{cls.confidence:.0%}</span>'
+            f'<span title="Strength">{cls.strength:.0%}</span>'
+            f'<span title="Emotion">{cls.emotionality:.0%}</span>'
+            f'</div></div></div>'
+        )
+    
+    if cards:
+        st.markdown("".join(cards), unsafe_allow_html=True)
+
+
+start_warmup()
+
 # ensure language stored in session state
 if 'lang' not in st.session_state:
     st.session_state.lang = 'en'  # default to English
@@ -37,106 +566,7 @@ st.set_page_config(
 )
 
 # Custom CSS - Light theme with proper contrast
-st.markdown("""
-<style>
-    /* Light background, dark text */
-    body {
-        background-color: #ffffff !important;
-        color: #262730 !important;
-    }
-    
-    /* Text visibility */
-    p, span, li, label {
-        color: #262730 !important;
-    }
-    
-    /* Headers */
-    h1, h2, h3, h4, h5, h6 {
-        color: #1f77b4 !important;
-    }
-    
-    /* Metric boxes */
-    .stMetric {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-        border: 1px solid #e0e0e0;
-    }
-    
-    .stMetric label {
-        color: #1f1f1f !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Input fields */
-    input, textarea, select {
-        background-color: #ffffff !important;
-        color: #262730 !important;
-        border: 1px solid #d0d0d0 !important;
-    }
-    
-    /* Buttons */
-    .stButton button {
-        background-color: #1f77b4 !important;
-        color: white !important;
-    }
-    
-    .stButton button:hover {
-        background-color: #1557a0 !important;
-    }
-    
-    /* Info boxes */
-    .stInfo {
-        background-color: #e3f2fd !important;
-        color: #1565c0 !important;
-    }
-    
-    .stWarning {
-        background-color: #fff3e0 !important;
-        color: #e65100 !important;
-    }
-    
-    .stSuccess {
-        background-color: #e8f5e9 !important;
-        color: #2e7d32 !important;
-    }
-    
-    .stError {
-        background-color: #ffebee !important;
-        color: #c62828 !important;
-    }
-
-    /* Responsive adjustments for mobile devices */
-    @media only screen and (max-width: 768px) {
-        /* stack columns vertically */
-        [data-testid="stColumns"] {
-            flex-direction: column !important;
-        }
-
-        /* make metrics full width */
-        .stMetric {
-            width: 100% !important;
-        }
-
-        /* adjust text area width and height */
-        textarea {
-            min-height: 150px !important;
-        }
-
-        /* reduce side padding of main container */
-        .block-container {
-            padding-left: 1rem !important;
-            padding-right: 1rem !important;
-        }
-
-        /* increase button padding for easier touch */
-        .stButton button {
-            padding: 0.75rem 1.25rem !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'text_input' not in st.session_state:
@@ -172,8 +602,7 @@ with st.sidebar:
         help=t(lang_code, "min_confidence_help")
     )
     
-    st.divider()
-    st.markdown(f"### {t(lang_code, 'about_header')}")
+    st.markdown(f"---\n### {t(lang_code, 'about_header')}")
     st.markdown(t(lang_code, "about_text"))
 
 # Main content
@@ -209,11 +638,10 @@ with col1:
 with col2:
     st.subheader(t(lang_code, "stats_header"))
     if text_input:
-        words = len(text_input.split())
-        chars = len(text_input)
+        chars, words, est_sentences = text_stats(text_input)
         st.metric(t(lang_code, "chars_label"), f"{chars:,}")
         st.metric(t(lang_code, "words_label"), f"{words:,}")
-        st.metric(t(lang_code, "est_sentences"), f"~{max(1, chars // 50)}")
+        st.metric(t(lang_code, "est_sentences"), f"~{est_sentences}")
 
 st.divider()
 
@@ -222,26 +650,8 @@ if st.button(t(lang_code, "analyze_button"), use_container_width=True, type="pri
     if text_input.strip():
         with st.spinner(t(lang_code, "analyzing_spinner")):
             try:
-                # Initialize components
-                processor = TextPreprocessor()
-                classifier = ArgumentClassifier()
-                builder = StructureBuilder()
-                
-                # Process
-                sentences = processor.process_text(text_input)
-                classifications = classifier.classify_arguments(sentences)
-                root_claims = builder.build_structure(classifications)
-                
-                # Store results
-                st.session_state.analysis_results = {
-                    'sentences': sentences,
-                    'classifications': classifications,
-                    'builder': builder,
-                    'argument_summary': classifier.get_argument_summary(classifications),
-                    'emotion_summary': EmotionAnalyzer().get_sentiment_summary(
-                        EmotionAnalyzer().analyze_emotions(sentences)
-                    )
-                }
+                wait_for_warmup()
+                st.session_state.analysis_results = run_pipeline(text_input)
                 
                 st.success(t(lang_code, "analysis_complete"))
                 
@@ -260,21 +670,19 @@ if st.session_state.analysis_results:
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
+    overview = results['overview']
+    
     with col1:
-        claim_count = results['argument_summary']['CLAIM']['count']
-        st.metric("🟢 Claims", claim_count)
+        st.metric("🟢 Claims", overview.claims)
     
     with col2:
-        support_count = results['argument_summary']['SUPPORT']['count']
-        st.metric("🔵 Supports", support_count)
+        st.metric("🔵 Supports", overview.supports)
     
     with col3:
-        counter_count = results['argument_summary']['COUNTER']['count']
-        st.metric("🟣 Counters", counter_count)
+        st.metric("🟣 Counters", overview.counters)
     
     with col4:
-        avg_strength = results['argument_summary']['CLAIM']['avg_strength'] if claim_count > 0 else 0
-        st.metric("💪 Avg Strength", f"{avg_strength:.1%}")
+        st.metric("💪 Avg Strength", f"{overview.avg_strength:.1%}")
     
     st.divider()
     
@@ -285,65 +693,23 @@ if st.session_state.analysis_results:
     
     # Tab 1: Arguments
     with tab1:
-        st.subheader(t(lang_code, "classified_args_header"))
-        
-        # Filter by type
-        arg_filter = st.multiselect(
-            "Filter by type:",
-            ["CLAIM", "SUPPORT", "COUNTER", "NEUTRAL"],
-            default=["CLAIM", "SUPPORT", "COUNTER"]
-        )
-        
-        for i, cls in enumerate(results['classifications'], 1):
-            if cls.argument_type not in arg_filter:
-                continue
-            
-            if cls.confidence < min_confidence:
-                continue
-            
-            icon = {
-                "CLAIM": "🟢",
-                "SUPPORT": "🔵",
-                "COUNTER": "🟣",
-                "NEUTRAL": "⚪"
-            }.get(cls.argument_type, "⚪")
-            
-            with st.container():
-                col1, col2 = st.columns([0.2, 0.8])
-                
-                with col1:
-                    st.markdown(f"### {icon}")
-                
-                with col2:
-                    st.markdown(f"**[{i}] {cls.argument_type}**")
-                    st.write(cls.sentence_text)
-                    
-                    col_a, col_b, col_c = st.columns(3)
-                    with col_a:
-                        st.metric("Confidence", f"{cls.confidence:.0%}", label_visibility="collapsed")
-                    with col_b:
-                        st.metric("Strength", f"{cls.strength:.0%}", label_visibility="collapsed")
-                    with col_c:
-                        st.metric("Emotion", f"{cls.emotionality:.0%}", label_visibility="collapsed")
-                
-                st.divider()
+        render_arguments(results, min_confidence, lang_code)
     
     # Tab 2: Structure
     with tab2:
         st.subheader(t(lang_code, "argument_tree_header"))
         
-        tree_ascii = results['builder'].visualize_ascii()
-        st.code(tree_ascii, language="text")
+        st.code(results['tree_ascii'], language="text")
         
         st.subheader(t(lang_code, "structure_stats_header"))
-        stats = results['builder'].get_tree_stats()
+        stats = results['tree_stats']
         
         col1, col2 = st.columns(2)
         with col1:
             st.metric("Total Nodes", stats['total_nodes'])
             st.metric("Max Depth", stats['max_depth'])
         with col2:
-            st.metric("Root Claims", len(results['builder'].root_claims))
+            st.metric("Root Claims", stats['num_root_claims'])
             st.metric("Avg Strength", f"{stats['avg_strength']:.2f}")
     
     # Tab 3: Emotions
@@ -354,76 +720,51 @@ if st.session_state.analysis_results:
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("😊 Positive", emotion_summary['positive'])
+            st.metric("😊 Positive", emotion_summary.positive)
         with col2:
-            st.metric("😐 Neutral", emotion_summary['neutral'])
+            st.metric("😐 Neutral", emotion_summary.neutral)
         with col3:
-            st.metric("😠 Negative", emotion_summary['negative'])
+            st.metric("😠 Negative", emotion_summary.negative)
         
         st.divider()
         
         # Sentiment chart with Plotly
-        sentiment_data = {
-            "Sentiment": ["Positive", "Neutral", "Negative"],
-            "Count": [
-                emotion_summary['positive'],
-                emotion_summary['neutral'],
-                emotion_summary['negative']
-            ]
-        }
-        
-        fig_sentiment = px.bar(
-            sentiment_data,
-            x='Sentiment',
-            y='Count',
-            color='Sentiment',
-            color_discrete_map={
-                'Positive': '#00cc96',
-                'Neutral': '#636EFA',
-                'Negative': '#ef553b'
-            }
-        )
-        fig_sentiment.update_layout(
-            height=350,
-            showlegend=False,
-            xaxis_title="",
-            yaxis_title="Count",
-            margin=dict(l=0, r=0, t=0, b=0)
+        fig_sentiment = sentiment_summary_figure(
+            emotion_summary.positive,
+            emotion_summary.neutral,
+            emotion_summary.negative
         )
         st.plotly_chart(fig_sentiment, use_container_width=True)
         
         st.divider()
-        st.metric("Avg Sentiment Score", f"{emotion_summary['avg_sentiment']:+.2f}")
-        st.metric("Avg Emotionality", f"{emotion_summary['avg_emotionality']:.2f}")
+        st.metric("Avg Sentiment Score", f"{emotion_summary.avg_sentiment:+.2f}")
+        st.metric("Avg Emotionality", f"{emotion_summary.avg_emotionality:.2f}")
     
     # Tab 4: Weaknesses
     with tab4:
         st.subheader(t(lang_code, "weaknesses_header"))
         
-        classifier = ArgumentClassifier()
-        
-        weakness_count = 0
-        for cls in results['classifications']:
-            feedback = classifier.detect_logical_weaknesses(cls)
-            # treat "None" entry as no weakness
-            real_feedback = [f for f in feedback if f.get('name') != 'None']
-            if real_feedback:
-                weakness_count += 1
-                with st.container():
-                    st.markdown(f"**📍 {cls.sentence_text}**")
-                    for f in real_feedback:
-                        st.markdown(f"- **{f['name']}**: {f['description']}")
-                        if f.get('strengthen'):
-                            st.info(f"💡 Strengthen: {f['strengthen']}")
-                        if f.get('counter_args'):
-                            for ca in f['counter_args']:
-                                st.warning(f"🟠 Counter-argument: {ca}")
-                        if f.get('pro_args'):
-                            for pa in f['pro_args']:
-                                st.success(f"✅ Pro-argument: {pa}")
-                    st.divider()
-        
-        if weakness_count == 0:
+        # Weaknesses are computed once in the cached pipeline
+        classifications = results['classifications']
+        weaknesses = results['weaknesses']
+        for position, idx in enumerate(results['weak_indices']):
+            cls, feedback = classifications[idx], weaknesses[idx]
+            with st.container():
+                # Rule between entries as part of the heading, not a divider element
+                rule = "---\n" if position else ""
+                st.markdown(f"{rule}**📍 {cls.sentence_text}**")
+                for f in feedback:
+                    st.markdown(f"- **{f['name']}**: {f['description']}")
+                    if f.get('strengthen'):
+                        st.info(f"💡 Strengthen: {f['strengthen']}")
+                    if f.get('counter_args'):
+                        for ca in f['counter_args']:
+                            st.warning(f"🟠 Counter-argument: {ca}")
+                    if f.get('pro_args'):
+                        for pa in f['pro_args']:
+                            st.success(f"✅ Pro-argument: {pa}")
+        
+        if not results['weak_indices']:
             st.success(t(lang_code, "no_weaknesses") if False else "✅ No major logical weaknesses detected!")
     
     # Tab 5: Details
@@ -433,133 +774,50 @@ if st.session_state.analysis_results:
         # Per-argument details
         st.markdown("### Full Argument List")
         
-        df_data = []
-        for cls in results['classifications']:
-            df_data.append({
-                "Type": cls.argument_type,
-                "Text": cls.sentence_text[:50] + "...",
-                "Confidence": f"{cls.confidence:.0%}",
-                "Strength": f"{cls.strength:.0%}",
-                "Sentiment": cls.sentiment,
-                "Emotionality": f"{cls.emotionality:.0%}"
-            })
-        
-        df = pd.DataFrame(df_data)
-        st.dataframe(df, use_container_width=True)
-        
-        st.divider()
+        df = results['analysis_frame']
+        df = df.assign(Text=truncate_texts(df["Text"], 50), **{column: df[column] * 100 for column in PERCENT_COLUMNS})
+        st.dataframe(df, column_config=DETAIL_COLUMN_CONFIG, use_container_width=True)
         
         # Raw JSON export
-        st.markdown("### Export as JSON")
-        export_data = {
-            "metadata": {
-                "total_sentences": len(results['classifications']),
-                "avg_strength": results['argument_summary']['CLAIM']['avg_strength'] if results['argument_summary']['CLAIM']['count'] > 0 else 0
-            },
-            "arguments": [
-                {
-                    "type": cls.argument_type,
-                    "text": cls.sentence_text,
-                    "confidence": cls.confidence,
-                    "strength": cls.strength,
-                    "sentiment": cls.sentiment,
-                    "emotionality": cls.emotionality
-                }
-                for cls in results['classifications']
-            ]
-        }
-        
-        import json
-        st.json(export_data)
+        st.markdown("---\n### Export as JSON")
+        export_json = results['export_json']
+        st.download_button(
+            "Download JSON",
+            data=export_json,
+            file_name="analysis.json",
+            mime="application/json"
+        )
+        preview = export_json if len(export_json) <= EXPORT_PREVIEW_CHARS else export_json[:EXPORT_PREVIEW_CHARS] + "\n..."
+        st.code(preview, language="json")
     
     # Tab 6: Visualizations
     with tab6:
         st.subheader(t(lang_code, "visualizations_header"))
         
-        # Prepare data for visualizations
-        df_analysis = pd.DataFrame([
-            {
-                "Type": cls.argument_type,
-                "Confidence": cls.confidence,
-                "Strength": cls.strength,
-                "Sentiment": cls.sentiment,
-                "Emotionality": cls.emotionality,
-                "Text": cls.sentence_text[:30] + "..."
-            }
-            for cls in results['classifications']
-        ])
+        # Same frame as the Details tab, with shorter hover texts
+        df_analysis = results['analysis_frame']
+        df_analysis = df_analysis.assign(Text=truncate_texts(df_analysis["Text"], 30))
+        
+        type_counts = tuple(results['type_counts'].tolist())
         
         # Row 1: Pie chart and Type distribution
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 🎯 Argument Type Distribution")
-            type_counts = df_analysis['Type'].value_counts()
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=type_counts.index,
-                values=type_counts.values,
-                marker=dict(
-                    colors=['#00cc96', '#636EFA', '#ab63fa', '#cccccc'][:len(type_counts)]
-                ),
-                hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-            )])
-            fig_pie.update_layout(
-                height=350,
-                showlegend=True,
-                margin=dict(l=0, r=0, t=0, b=0)
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(type_pie_figure(type_counts), use_container_width=True)
         
         with col2:
             st.markdown("#### 💪 Strength by Argument Type")
-            fig_strength = px.box(
-                df_analysis,
-                x='Type',
-                y='Strength',
-                color='Type',
-                color_discrete_map={
-                    'CLAIM': '#00cc96',
-                    'SUPPORT': '#636EFA',
-                    'COUNTER': '#ab63fa',
-                    'NEUTRAL': '#cccccc'
-                },
-                points='all'
-            )
-            fig_strength.update_layout(
-                height=350,
-                showlegend=False,
-                xaxis_title="",
-                yaxis_title="Strength Score",
-                margin=dict(l=0, r=0, t=0, b=0)
-            )
-            st.plotly_chart(fig_strength, use_container_width=True)
-        
-        st.divider()
+            st.plotly_chart(strength_box_figure(df_analysis[['Type', 'Strength']]), use_container_width=True)
         
         # Row 2: Confidence vs Strength scatter plot
-        st.markdown("#### 📍 Confidence vs Strength Analysis")
-        fig_scatter = px.scatter(
-            df_analysis,
-            x='Confidence',
-            y='Strength',
-            color='Type',
-            size='Emotionality',
-            hover_data=['Text', 'Sentiment'],
-            color_discrete_map={
-                'CLAIM': '#00cc96',
-                'SUPPORT': '#636EFA',
-                'COUNTER': '#ab63fa',
-                'NEUTRAL': '#cccccc'
-            }
-        )
-        fig_scatter.update_layout(
-            height=400,
-            xaxis_title="Confidence Score",
-            yaxis_title="Argument Strength",
-            hovermode='closest',
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
-        st.plotly_chart(fig_scatter, use_container_width=True)
+        st.markdown("---\n#### 📍 Confidence vs Strength Analysis")
+        df_scatter = df_analysis
+        if len(df_analysis) > SCATTER_MAX_POINTS:
+            df_scatter = df_analysis.sample(SCATTER_MAX_POINTS, random_state=0)
+            st.caption(f"Showing {SCATTER_MAX_POINTS} of {len(df_analysis)} points")
+        st.plotly_chart(confidence_scatter_figure(df_scatter), use_container_width=True)
         
         st.divider()
         
@@ -569,88 +827,28 @@ if st.session_state.analysis_results:
         with col1:
             st.markdown("#### 😊 Sentiment Distribution")
             sentiment_counts = df_analysis['Sentiment'].value_counts()
-            fig_sentiment = px.bar(
-                x=sentiment_counts.index,
-                y=sentiment_counts.values,
-                labels={'x': 'Sentiment', 'y': 'Count'},
-                color=sentiment_counts.index,
-                color_discrete_map={
-                    'POSITIVE': '#00cc96',
-                    'NEUTRAL': '#636EFA',
-                    'NEGATIVE': '#ef553b'
-                }
-            )
-            fig_sentiment.update_layout(
-                height=350,
-                showlegend=False,
-                xaxis_title="",
-                yaxis_title="Count",
-                margin=dict(l=0, r=0, t=0, b=0)
+            fig_sentiment = sentiment_counts_figure(
+                tuple(sentiment_counts.index),
+                tuple(sentiment_counts.tolist())
             )
             st.plotly_chart(fig_sentiment, use_container_width=True)
         
         with col2:
             st.markdown("#### 🔥 Emotionality Distribution")
-            fig_emotion_hist = px.histogram(
-                df_analysis,
-                x='Emotionality',
-                nbins=15,
-                color_discrete_sequence=['#ab63fa']
-            )
-            fig_emotion_hist.update_layout(
-                height=350,
-                showlegend=False,
-                xaxis_title="Emotionality Score",
-                yaxis_title="Frequency",
-                margin=dict(l=0, r=0, t=0, b=0)
-            )
-            st.plotly_chart(fig_emotion_hist, use_container_width=True)
-        
-        st.divider()
+            st.plotly_chart(emotionality_histogram_figure(df_analysis['Emotionality'].to_numpy()), use_container_width=True)
         
         # Row 4: Radar chart
-        st.markdown("#### 🎯 Overall Metrics Radar")
-        
-        # Compute averages by type
-        radar_data = df_analysis.groupby('Type')[['Confidence', 'Strength', 'Emotionality']].mean()
+        st.markdown("---\n#### 🎯 Overall Metrics Radar")
         
-        fig_radar = go.Figure()
-        
-        for arg_type in radar_data.index:
-            fig_radar.add_trace(go.Scatterpolar(
-                r=[
-                    radar_data.loc[arg_type, 'Confidence'],
-                    radar_data.loc[arg_type, 'Strength'],
-                    radar_data.loc[arg_type, 'Emotionality']
-                ],
-                theta=['Confidence', 'Strength', 'Emotionality'],
-                fill='toself',
-                name=arg_type
-            ))
-        
-        fig_radar.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 1])),
-            height=450,
-            showlegend=True,
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
-        st.plotly_chart(fig_radar, use_container_width=True)
-        
-        st.divider()
+        # Averages by type come precomputed from the pipeline (rows = type codes)
+        st.plotly_chart(type_radar_figure(type_counts, results['type_means']), use_container_width=True)
         
         # Row 5: Summary statistics table
-        st.markdown("#### 📊 Summary Statistics by Type")
+        st.markdown("---\n#### 📊 Summary Statistics by Type")
         
-        summary_stats = df_analysis.groupby('Type').agg({
-            'Confidence': ['mean', 'min', 'max', 'std'],
-            'Strength': ['mean', 'min', 'max', 'std'],
-            'Emotionality': ['mean', 'min', 'max', 'std']
-        }).round(3)
-        
-        st.dataframe(summary_stats, use_container_width=True)
+        st.dataframe(results['summary_frame'], use_container_width=True)
 
-# Footer
-st.divider()
+# Footer (the markdown starts with its own rule)
 st.markdown("""
 ---
 **🧠 Argument Structure Analyzer** | [GitHub](https://github.com) | [Documentation](README.md)
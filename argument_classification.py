@@ -2,15 +2,28 @@
 Argument Classification Module: Klassifiziert Sätze nach Argumenttyp
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+import heapq
+import re
+import numpy as np
 from claim_detection import ClaimDetector, ClaimResult
 from emotion_analysis import EmotionAnalyzer, EmotionResult
 
 
+# Symbole pro Argumenttyp (Konsolenausgabe)
+_ICONS = {"CLAIM": "🟢", "SUPPORT": "🔵", "COUNTER": "🟣", "NEUTRAL": "⚪"}
+
+
 @dataclass
 class ArgumentClassification:
     """Vollständige Klassifikation eines Arguments"""
+    # Kein __dict__ pro Instanz (dataclass(slots=True) erst ab Python 3.10)
+    __slots__ = ("sentence_text", "argument_type", "confidence", "sentiment",
+                 "emotionality", "keywords", "strength")
+    
     sentence_text: str
     argument_type: str  # "CLAIM", "SUPPORT", "COUNTER", "NEUTRAL"
     confidence: float
@@ -23,41 +36,102 @@ class ArgumentClassification:
 class ArgumentClassifier:
     """Kombiniert verschiedene Analysen zur Argument-Klassifikation"""
     
+    # Argumenttypen (dieselben Objekte wie in den ClaimResults)
+    CLAIM = ClaimDetector.CLAIM
+    SUPPORT = ClaimDetector.SUPPORT
+    COUNTER = ClaimDetector.COUNTER
+    NEUTRAL = ClaimDetector.NEUTRAL
+    ARGUMENT_TYPES = (CLAIM, SUPPORT, COUNTER, NEUTRAL)
+    
+    # Wortlisten für die Schwächen-Erkennung
+    SUPERLATIVE_WORDS = ("absolutely", "definitely", "certainly", "obviously", "clearly")
+    AD_HOMINEM_WORDS = ("stupid", "idiot", "fool", "moron", "ignorant")
+    GENERALIZATION_WORDS = ("all", "never", "always", "everybody", "nobody")
+    
+    # Wortmengen für exakte Treffer auf den Wörtern eines Satzes ("all"
+    # nicht in "small", "fool" nicht in "foolish"); Beschimpfungen auch im Plural
+    _SUPERLATIVE_SET = frozenset(SUPERLATIVE_WORDS)
+    _AD_HOMINEM_SET = frozenset(AD_HOMINEM_WORDS) | frozenset(word + "s" for word in AD_HOMINEM_WORDS)
+    _GENERALIZATION_SET = frozenset(GENERALIZATION_WORDS)
+    _WORD_RE = re.compile(r"\w+")
+    _IS_RE = re.compile(r"\bis\b")  # Vorkommen zählen, nicht nur Enthaltensein
+    
     def __init__(self):
-        """Initialisiert Classifier mit Submodulen"""
-        self.claim_detector = ClaimDetector()
-        self.emotion_analyzer = EmotionAnalyzer()
+        """Initialisiert Classifier mit Submodulen (geteilte Instanzen)"""
+        self.claim_detector = ClaimDetector.instance()
+        self.emotion_analyzer = EmotionAnalyzer.instance()
     
-    def classify_arguments(self, sentences: List) -> List[ArgumentClassification]:
+    def classify_arguments(self, sentences: List, emotion_results: Optional[List[EmotionResult]] = None) -> List[ArgumentClassification]:
         """
         Klassifiziert alle Sätze nach Argumenttyp und Qualität
         Args:
             sentences: Liste von Sentence-Objekten
+            emotion_results: Bereits berechnete Emotionsanalyse derselben
+                Sätze (wird sonst hier berechnet)
         Returns:
             Liste von ArgumentClassification-Objekten
         """
+        if emotion_results is None:
+            return self.analyze_batch(sentences)[0]
+        
         # Nutze vorhandene Detektoren
         claim_results = self.claim_detector.detect_claims(sentences)
-        emotion_results = self.emotion_analyzer.analyze_emotions(sentences)
-        
-        classifications = []
-        for claim_result, emotion_result in zip(claim_results, emotion_results):
-            classification = self._combine_analyses(claim_result, emotion_result)
-            classifications.append(classification)
+        return self._combine_all(claim_results, emotion_results)
+    
+    def analyze_batch(self, sentences: List) -> Tuple[List[ArgumentClassification], List[EmotionResult]]:
+        """
+        Claim- und Emotionsanalyse aller Sätze in einem Aufruf
         
-        return classifications
+        Beide Analysen arbeiten auf dem vorab kleingeschriebenen Satz-Text
+        (Sentence.text_lower); das Claim-Scoring läuft als Batch.
+        Args:
+            sentences: Liste von Sentence-Objekten
+        Returns:
+            (Klassifikationen, Emotionsergebnisse) in Satz-Reihenfolge
+        """
+        claim_results = self.claim_detector.detect_claims(sentences)
+        emotion_results = self.emotion_analyzer.analyze_emotions(sentences)
+        return self._combine_all(claim_results, emotion_results), emotion_results
     
-    def _combine_analyses(self, claim_result: ClaimResult, emotion_result: EmotionResult) -> ArgumentClassification:
+    def _combine_all(self, claim_results: List[ClaimResult], emotion_results: List[EmotionResult]) -> List[ArgumentClassification]:
+        """
+        Kombiniert die Analysen aller Sätze; die Stärken werden vorab in
+        einem vektorisierten Schritt berechnet
+        Args:
+            claim_results: Claim-Erkennungsergebnisse
+            emotion_results: Emotionsanalyse-Ergebnisse derselben Sätze
+        Returns:
+            Liste von ArgumentClassification-Objekten
+        """
+        strengths = self._calculate_argument_strengths(claim_results, emotion_results)
+        # Wie _combine_analyses, aber ohne Funktionsaufruf pro Satz
+        return [
+            ArgumentClassification(
+                sentence_text=claim_result.sentence_text,
+                argument_type=claim_result.claim_type,
+                confidence=claim_result.confidence,
+                sentiment=emotion_result.sentiment,
+                emotionality=emotion_result.emotionality,
+                keywords=[*claim_result.markers, *emotion_result.emotion_keywords],
+                strength=strength
+            )
+            for claim_result, emotion_result, strength in zip(claim_results, emotion_results, strengths)
+        ]
+    
+    def _combine_analyses(self, claim_result: ClaimResult, emotion_result: EmotionResult,
+                          strength: Optional[float] = None) -> ArgumentClassification:
         """
         Kombiniert Claim- und Emotionsanalyse
         Args:
             claim_result: Claim-Erkennungsergebnis
             emotion_result: Emotionsanalyse-Ergebnis
+            strength: Bereits berechnete Stärke (wird sonst hier berechnet)
         Returns:
             Kombinierte Klassifikation
         """
         # Berechne Argument-Stärke basierend auf verschiedenen Faktoren
-        strength = self._calculate_argument_strength(claim_result, emotion_result)
+        if strength is None:
+            strength = self._calculate_argument_strength(claim_result, emotion_result)
         
         return ArgumentClassification(
             sentence_text=claim_result.sentence_text,
@@ -65,7 +139,7 @@ class ArgumentClassifier:
             confidence=claim_result.confidence,
             sentiment=emotion_result.sentiment,
             emotionality=emotion_result.emotionality,
-            keywords=claim_result.markers + emotion_result.emotion_keywords,
+            keywords=[*claim_result.markers, *emotion_result.emotion_keywords],
             strength=strength
         )
     
@@ -93,7 +167,7 @@ class ArgumentClassifier:
         emotionality_factor = max(0.5, 1.0 - emotionality_penalty)
         
         # Sentiment negativer Gegenargumente ist normal
-        if claim_result.claim_type == "COUNTER":
+        if claim_result.claim_type == self.COUNTER:
             sentiment_neutral_bonus = 0.2 if emotion_result.sentiment == "negative" else -0.1
         else:
             sentiment_neutral_bonus = 0.2 if emotion_result.sentiment in ["positive", "neutral"] else -0.1
@@ -107,6 +181,32 @@ class ArgumentClassifier:
         
         return min(1.0, max(0.0, strength))
     
+    def _calculate_argument_strengths(self, claim_results: List[ClaimResult], emotion_results: List[EmotionResult]) -> List[float]:
+        """
+        Vektorisierte Variante von _calculate_argument_strength für alle Sätze
+        Args:
+            claim_results: Claim-Results
+            emotion_results: EmotionResults derselben Sätze
+        Returns:
+            Strength Scores 0.0 - 1.0 (gleiche Werte wie die Einzelberechnung)
+        """
+        n = len(claim_results)
+        confidence = np.fromiter((r.confidence for r in claim_results), dtype=np.float64, count=n)
+        emotionality = np.fromiter((r.emotionality for r in emotion_results), dtype=np.float64, count=n)
+        is_counter = np.fromiter((r.claim_type == self.COUNTER for r in claim_results), dtype=np.bool_, count=n)
+        is_negative = np.fromiter((r.sentiment == "negative" for r in emotion_results), dtype=np.bool_, count=n)
+        
+        emotionality_factor = np.maximum(0.5, 1.0 - np.abs(emotionality - 0.3))
+        # Gegenargumente: negativ = Bonus; sonst: positiv/neutral = Bonus
+        sentiment_neutral_bonus = np.where(is_counter == is_negative, 0.2, -0.1)
+        
+        strength = (
+            confidence * 0.5 +
+            emotionality_factor * 0.3 +
+            (0.5 + sentiment_neutral_bonus) * 0.2
+        )
+        return np.clip(strength, 0.0, 1.0).tolist()
+    
     def get_argument_summary(self, classifications: List[ArgumentClassification]) -> Dict:
         """
         Gibt Zusammenfassung aller Argumente
@@ -115,18 +215,28 @@ class ArgumentClassifier:
         Returns:
             Dictionary mit Statistiken
         """
-        types = {"CLAIM": [], "SUPPORT": [], "COUNTER": [], "NEUTRAL": []}
+        # Ein Durchlauf: Anzahl, Summen und die ersten 2 Beispiele pro Typ
+        stats = {
+            arg_type: {"count": 0, "sum_strength": 0.0, "sum_emotionality": 0.0, "examples": []}
+            for arg_type in self.ARGUMENT_TYPES
+        }
         
         for cls in classifications:
-            types[cls.argument_type].append(cls)
+            entry = stats[cls.argument_type]
+            entry["count"] += 1
+            entry["sum_strength"] += cls.strength
+            entry["sum_emotionality"] += cls.emotionality
+            if len(entry["examples"]) < 2:
+                entry["examples"].append(cls.sentence_text[:60] + "...")
         
         summary = {}
-        for arg_type, items in types.items():
+        for arg_type, entry in stats.items():
+            count = entry["count"]
             summary[arg_type] = {
-                "count": len(items),
-                "avg_strength": sum(c.strength for c in items) / len(items) if items else 0.0,
-                "avg_emotionality": sum(c.emotionality for c in items) / len(items) if items else 0.0,
-                "examples": [c.sentence_text[:60] + "..." for c in items[:2]]  # Erste 2 Beispiele
+                "count": count,
+                "avg_strength": entry["sum_strength"] / count if count else 0.0,
+                "avg_emotionality": entry["sum_emotionality"] / count if count else 0.0,
+                "examples": entry["examples"]
             }
         
         return summary
@@ -142,13 +252,44 @@ class ArgumentClassifier:
             Sortierte Liste nach Strength
         """
         if arg_type:
-            filtered = [c for c in classifications if c.argument_type == arg_type]
+            filtered = (c for c in classifications if c.argument_type == arg_type)
         else:
             filtered = classifications
         
-        return sorted(filtered, key=lambda c: c.strength, reverse=True)[:top_n]
+        # Wie sorted(...)[:top_n] (gleiche Reihenfolge bei Gleichstand), ohne Vollsortierung
+        return heapq.nlargest(top_n, filtered, key=attrgetter("strength"))
     
     def detect_logical_weaknesses(self, classification: ArgumentClassification) -> List[Dict]:
+        """
+        Wie get_logical_weaknesses, liefert aber einen "None"-Eintrag,
+        wenn keine Schwäche erkannt wurde (für Ausgaben, die immer ein
+        Feedback anzeigen).
+        Args:
+            classification: ArgumentClassification-Objekt
+        Returns:
+            Nicht-leere Liste von Diktaten
+        """
+        feedback = self.get_logical_weaknesses(classification)
+        if not feedback:
+            feedback.append({
+                "name": "None",
+                "description": "✅ Keine offensichtlichen Schwächen erkannt",
+                "strengthen": "Dein Argument erscheint logisch solide – weiter so!"
+            })
+        return feedback
+
+    def get_logical_weaknesses_batch(self, classifications: List[ArgumentClassification]) -> List[List[Dict]]:
+        """
+        Erkennt logische Schwächen für alle Klassifikationen in einem Aufruf
+        Args:
+            classifications: Liste von ArgumentClassification
+        Returns:
+            Pro Klassifikation die Liste ihrer Schwächen (leer = keine)
+        """
+        detect = self.get_logical_weaknesses
+        return [detect(cls) for cls in classifications]
+
+    def get_logical_weaknesses(self, classification: ArgumentClassification) -> List[Dict]:
         """
         Heuristische Erkennung logischer Schwächen
 
@@ -158,7 +299,7 @@ class ArgumentClassifier:
         Args:
             classification: ArgumentClassification-Objekt
         Returns:
-            Liste von Diktaten. Beispiel:
+            Liste von Diktaten (leer, wenn keine Schwäche erkannt). Beispiel:
             [{
                 "name": "Ad Hominem",
                 "description": "Angriff auf Person statt auf das Argument.",
@@ -167,16 +308,48 @@ class ArgumentClassifier:
                 "pro_args": ["Stütze deine Aussage mit Quellen anstelle von Persönlichkeitskritik."]
             }]
         """
+        # Ergebnis hängt nur vom Text und zwei Schwellwert-Entscheidungen ab
+        cached = self._detect_weaknesses(
+            classification.sentence_text.lower(),
+            classification.emotionality > 0.7,
+            classification.argument_type == self.SUPPORT,
+        )
+        # Frische Dicts und Listen, damit Aufrufer die Einträge samt
+        # counter_args/pro_args verändern können, ohne den Cache zu treffen
+        return [
+            {key: list(value) if isinstance(value, tuple) else value
+             for key, value in entry}
+            for entry in cached
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _detect_weaknesses(cls, text_lower: str, high_emotionality: bool, is_support: bool) -> Tuple[Tuple, ...]:
+        """
+        Gecachter Kern von get_logical_weaknesses
+        Args:
+            text_lower: Kleingeschriebener Satz-Text
+            high_emotionality: Emotionalität über 0.7
+            is_support: Argumenttyp ist SUPPORT
+        Returns:
+            Tuple der Schwächen-Einträge als (Schlüssel, Wert)-Paare,
+            Listen als Tupel eingefroren (geteilt, nicht verändern)
+        """
         feedback = []
-        text_lower = classification.sentence_text.lower()
+        seen = set()
+        words = set(cls._WORD_RE.findall(text_lower))
 
         def add(entry):
             # vermeide doppelte Einträge gleichen Namens
-            if not any(e['name'] == entry['name'] for e in feedback):
-                feedback.append(entry)
+            if entry['name'] not in seen:
+                seen.add(entry['name'])
+                feedback.append(tuple(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in entry.items()
+                ))
 
         # Appeal to emotion (hohe Emotionalität)
-        if classification.emotionality > 0.7:
+        if high_emotionality:
             add({
                 "name": "Appeal to Emotion",
                 "description": "Argument basiert stark auf emotionaler Sprache statt auf Fakten.",
@@ -190,8 +363,8 @@ class ArgumentClassifier:
             })
 
         # Superlative / Übertreibung
-        superlatives = ["absolutely", "definitely", "certainly", "obviously", "clearly"]
-        superlative_count = sum(1 for s in superlatives if s in text_lower)
+        # Anzahl verschiedener Superlative, nicht ihrer Wiederholungen
+        superlative_count = len(words & cls._SUPERLATIVE_SET)
         if superlative_count >= 2:
             add({
                 "name": "Hasty Generalization",
@@ -200,8 +373,7 @@ class ArgumentClassifier:
             })
 
         # Ad-Hominem Angriffe
-        ad_hominem_words = ["stupid", "idiot", "fool", "moron", "ignorant"]
-        if any(word in text_lower for word in ad_hominem_words):
+        if not words.isdisjoint(cls._AD_HOMINEM_SET):
             add({
                 "name": "Ad Hominem",
                 "description": "Angriff auf die Person statt auf das Argument.",
@@ -215,8 +387,7 @@ class ArgumentClassifier:
             })
 
         # Verallgemeinerungen
-        generalization_words = ["all", "never", "always", "everybody", "nobody"]
-        if any(word in text_lower for word in generalization_words):
+        if not words.isdisjoint(cls._GENERALIZATION_SET):
             add({
                 "name": "Hasty Generalization",
                 "description": "Zieht eine allgemeine Schlussfolgerung aus unzureichenden Beispielen.",
@@ -230,7 +401,7 @@ class ArgumentClassifier:
             })
 
         # Zirkelschluss-Muster
-        if "is" in text_lower and text_lower.count("is") > 2:
+        if len(cls._IS_RE.findall(text_lower)) > 2:
             add({
                 "name": "Circular Reasoning",
                 "description": "Das Argument benutzt seine eigene Schlussfolgerung als Prämisse.",
@@ -238,7 +409,7 @@ class ArgumentClassifier:
             })
 
         # Fehlendes Belege bei Support
-        if classification.argument_type == "SUPPORT" and "believe" in text_lower:
+        if is_support and "believe" in text_lower:
             add({
                 "name": "Appeal to Belief",
                 "description": "Stützt sich mehr auf Glauben als auf überprüfbare Fakten.",
@@ -251,14 +422,7 @@ class ArgumentClassifier:
                 ]
             })
 
-        if not feedback:
-            feedback.append({
-                "name": "None",
-                "description": "✅ Keine offensichtlichen Schwächen erkannt",
-                "strengthen": "Dein Argument erscheint logisch solide – weiter so!"
-            })
-
-        return feedback
+        return tuple(feedback)
 
 
 if __name__ == "__main__":
@@ -283,9 +447,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     for cls in classifications:
-        icon = "🟢" if cls.argument_type == "CLAIM" else \
-               "🔵" if cls.argument_type == "SUPPORT" else \
-               "🟣" if cls.argument_type == "COUNTER" else "⚪"
+        icon = _ICONS.get(cls.argument_type, "⚪")
         
         print(f"\n{icon} {cls.argument_type} | Strength: {cls.strength:.2f} | Confidence: {cls.confidence:.2f}")
         print(f"   Text: {cls.sentence_text}")
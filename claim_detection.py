@@ -2,15 +2,31 @@
 Claim Detection Module: Erkennung von Hauptthesen und Argumente-Markern
 """
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except (ImportError, Exception):
+    AHOCORASICK_AVAILABLE = False
+
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 import re
+import threading
+import numpy as np
 from preprocessing import Sentence
+from numeric_kernels import score_marker_hits
+
+
+# Symbole pro Argumenttyp (Konsolenausgabe)
+_ICONS = {"CLAIM": "🟢", "SUPPORT": "🔵", "COUNTER": "🟣", "NEUTRAL": "⚪"}
 
 
 @dataclass
 class ClaimResult:
     """Ergebnis der Claim-Erkennung"""
+    # Kein __dict__ pro Instanz (dataclass(slots=True) erst ab Python 3.10)
+    __slots__ = ("sentence_text", "confidence", "markers", "claim_type")
+    
     sentence_text: str
     confidence: float  # 0.0 - 1.0
     markers: List[str]  # Gefundene Marker
@@ -108,13 +124,83 @@ class ClaimDetector:
         "obviously": 0.75,
     }
     
+    # Argumenttypen; Ergebnisse verwenden genau diese String-Objekte
+    CLAIM = "CLAIM"
+    SUPPORT = "SUPPORT"
+    COUNTER = "COUNTER"
+    NEUTRAL = "NEUTRAL"
+    
+    # Marker-Typen in Auswertungsreihenfolge (Index = Typ-Index der Marker-Einträge)
+    MARKER_TYPES = (CLAIM, SUPPORT, COUNTER)
+    
+    # Zusammengeführte Marker pro Typ (einmal beim Import)
+    ALL_MARKERS = {
+        CLAIM: {**CLAIM_MARKERS, **MODAL_VERBS, **BELIEF_MARKERS},
+        SUPPORT: SUPPORT_MARKERS,
+        COUNTER: COUNTER_MARKERS,
+    }
+    
+    _init_lock = threading.RLock()  # schützt geteilte Instanz und Index-Aufbau
+    _index_owner = None  # Klasse, für die der Suchindex gebaut wurde
+    
     def __init__(self):
         """Initialisiert Detector"""
-        self.all_markers = {
-            "CLAIM": {**self.CLAIM_MARKERS, **self.MODAL_VERBS, **self.BELIEF_MARKERS},
-            "SUPPORT": self.SUPPORT_MARKERS,
-            "COUNTER": self.COUNTER_MARKERS,
-        }
+        self.all_markers = self.ALL_MARKERS
+        self._build_index()
+    
+    @classmethod
+    def instance(cls) -> "ClaimDetector":
+        """Prozessweit geteilte Instanz; der Detector ändert nach dem Aufbau keinen Zustand"""
+        if cls.__dict__.get("_shared") is None:
+            # Warm-up und Sitzungen rufen parallel auf: nur einmal bauen
+            with cls._init_lock:
+                if cls.__dict__.get("_shared") is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    @classmethod
+    def _build_index(cls):
+        """Baut Marker-Einträge, Spalten und Automat einmal pro Klasse"""
+        if cls._index_owner is cls:
+            return
+        with cls._init_lock:
+            if cls._index_owner is not cls:
+                cls._build_index_locked()
+    
+    @classmethod
+    def _build_index_locked(cls):
+        """Eigentlicher Aufbau von _build_index; nur unter _init_lock aufrufen"""
+        # Flache Marker-Liste in Suchreihenfolge: (Rang, Typ-Index, Marker, Confidence)
+        cls._marker_entries = [
+            (rank, type_index, marker, confidence)
+            for rank, (type_index, marker, confidence) in enumerate(
+                (type_index, marker, confidence)
+                for type_index, claim_type in enumerate(cls.MARKER_TYPES)
+                for marker, confidence in cls.ALL_MARKERS[claim_type].items()
+            )
+        ]
+        
+        # Anfangsbuchstaben aller Marker: Sätze ohne einen davon enthalten
+        # sicher keinen Marker
+        cls._first_chars = frozenset(entry[2][0] for entry in cls._marker_entries)
+        
+        # Dieselben Einträge spaltenweise, indiziert über die Marker-ID (= Rang)
+        cls._marker_type_ids = np.array([entry[1] for entry in cls._marker_entries], dtype=np.int8)
+        cls._marker_confs = np.array([entry[3] for entry in cls._marker_entries], dtype=np.float64)
+        
+        # Ein Automat findet alle Marker in einem Durchlauf über den Satz;
+        # ein Marker kann mehreren Typen angehören ("this proves")
+        cls._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            entries_by_marker = {}
+            for entry in cls._marker_entries:
+                entries_by_marker.setdefault(entry[2], []).append(entry)
+            cls._automaton = ahocorasick.Automaton()
+            for marker, entries in entries_by_marker.items():
+                cls._automaton.add_word(marker, tuple(entries))
+            cls._automaton.make_automaton()
+        
+        cls._index_owner = cls
     
     def detect_claims(self, sentences: List[Sentence]) -> List[ClaimResult]:
         """
@@ -124,10 +210,27 @@ class ClaimDetector:
         Returns:
             Liste von ClaimResult-Objekten
         """
+        # Treffer aller Sätze als CSR (Marker-IDs + Offsets); die Auswertung
+        # pro Typ läuft für alle Sätze in einem kompilierten Kernel
+        hits_per_sentence = [self._find_markers(sent.text_lower) for sent in sentences]
+        offsets = np.zeros(len(sentences) + 1, dtype=np.int64)
+        np.cumsum([len(hits) for hits in hits_per_sentence], out=offsets[1:])
+        hit_ids = np.fromiter(
+            (entry[0] for hits in hits_per_sentence for entry in hits),
+            dtype=np.int64, count=int(offsets[-1])
+        )
+        best_types, confidences = score_marker_hits(
+            hit_ids, offsets, self._marker_type_ids, self._marker_confs, len(self.MARKER_TYPES)
+        )
+        
         results = []
-        for sent in sentences:
-            result = self._analyze_sentence(sent)
-            results.append(result)
+        for sent, hits, best_type, confidence in zip(sentences, hits_per_sentence, best_types.tolist(), confidences.tolist()):
+            results.append(ClaimResult(
+                sentence_text=sent.text,
+                confidence=confidence,
+                markers=[entry[2] for entry in hits if entry[1] == best_type],
+                claim_type=self.MARKER_TYPES[best_type] if best_type >= 0 else self.NEUTRAL
+            ))
         return results
     
     def _analyze_sentence(self, sentence: Sentence) -> ClaimResult:
@@ -138,49 +241,70 @@ class ClaimDetector:
         Returns:
             ClaimResult
         """
-        text_lower = sentence.text.lower()
-        
-        # Sammle Marker und Confidence-Scores pro Typ
-        type_scores = {
-            "CLAIM": [],
-            "SUPPORT": [],
-            "COUNTER": [],
-            "NEUTRAL": [0.0]  # Default Neutral
-        }
-        
-        found_markers = {
-            "CLAIM": [],
-            "SUPPORT": [],
-            "COUNTER": [],
-        }
+        return self._analyze_text(sentence.text, sentence.text_lower)
+    
+    def _analyze_text(self, text: str, text_lower: str) -> ClaimResult:
+        """
+        Analysiert einen Satz-Text, der bereits kleingeschrieben vorliegt
+        Args:
+            text: Original-Text des Satzes
+            text_lower: text.lower()
+        Returns:
+            ClaimResult
+        """
+        # Laufende Summe, Anzahl und Marker pro Typ (Index in MARKER_TYPES)
+        sums = [0.0, 0.0, 0.0]
+        counts = [0, 0, 0]
+        found_markers = ([], [], [])
         
         # Suche nach Markern
-        for claim_type, markers in self.all_markers.items():
-            for marker, confidence in markers.items():
-                if marker in text_lower:
-                    type_scores[claim_type].append(confidence)
-                    found_markers[claim_type].append(marker)
+        for _, type_index, marker, confidence in self._find_markers(text_lower):
+            sums[type_index] += confidence
+            counts[type_index] += 1
+            found_markers[type_index].append(marker)
         
-        # Berechne beste Klassifikation
-        claim_type = "NEUTRAL"
+        # Berechne beste Klassifikation: höchster Durchschnitt, bei
+        # Gleichstand der erste Typ; ohne Treffer NEUTRAL mit 0.0
+        claim_type = self.NEUTRAL
         confidence = 0.0
         markers = []
         
-        for ctype, scores in type_scores.items():
-            if scores:
-                avg_score = sum(scores) / len(scores)
+        for type_index in range(3):
+            if counts[type_index]:
+                avg_score = sums[type_index] / counts[type_index]
                 if avg_score > confidence:
                     confidence = avg_score
-                    claim_type = ctype
-                    markers = found_markers[ctype]
+                    claim_type = self.MARKER_TYPES[type_index]
+                    markers = found_markers[type_index]
         
         return ClaimResult(
-            sentence_text=sentence.text,
+            sentence_text=text,
             confidence=confidence,
             markers=markers,
             claim_type=claim_type
         )
     
+    def _find_markers(self, text_lower: str) -> List[Tuple[int, int, str, float]]:
+        """
+        Alle im Text enthaltenen Marker (Teilstring-Treffer, je Marker einmal)
+        Args:
+            text_lower: Kleingeschriebener Satz-Text
+        Returns:
+            Marker-Einträge (Rang, Typ-Index, Marker, Confidence) in Suchreihenfolge
+        """
+        # isdisjoint bricht beim ersten passenden Zeichen ab: kostet bei
+        # Sätzen mit Markern fast nichts, erspart sonst die eigentliche Suche
+        if self._first_chars.isdisjoint(text_lower):
+            return []
+        if self._automaton is None:
+            return [entry for entry in self._marker_entries if entry[2] in text_lower]
+        
+        hits = set()
+        for _, entries in self._automaton.iter(text_lower):
+            hits.update(entries)
+        # Sortierung nach Rang erhält Reihenfolge von Markern und Score-Summen
+        return sorted(hits)
+    
     def get_main_claims(self, results: List[ClaimResult], threshold: float = 0.6) -> List[ClaimResult]:
         """
         Filtert nur Hauptclaims (hohe Confidence)
@@ -233,9 +357,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     for result in results:
-        icon = "🟢" if result.claim_type == "CLAIM" else \
-               "🔵" if result.claim_type == "SUPPORT" else \
-               "🟣" if result.claim_type == "COUNTER" else "⚪"
+        icon = _ICONS.get(result.claim_type, "⚪")
         
         print(f"\n{icon} {result.claim_type} (confidence: {result.confidence:.2f})")
         print(f"   Text: {result.sentence_text}")
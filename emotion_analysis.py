@@ -2,14 +2,44 @@
 Emotion Analysis Module: Sentiment-Analyse und emotionale Sprache-Erkennung
 """
 
-from typing import List, Dict
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except (ImportError, Exception):
+    AHOCORASICK_AVAILABLE = False
+
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
+import threading
+import numpy as np
+from numeric_kernels import score_emotion_hits
+
+
+# Symbole pro Sentiment (Konsolenausgabe)
+_ICONS = {"positive": "😊", "negative": "😠", "neutral": "😐"}
+
+
+def _word_forms(word: str) -> Tuple[str, str, str]:
+    """Regelmäßige Beugungsformen eines Worts: Plural/3. Person, Vergangenheit, -ing"""
+    plural = word + "es" if word.endswith(("s", "x", "ch", "sh")) else word + "s"
+    past = word + "d" if word.endswith("e") else word + "ed"
+    gerund = word[:-1] + "ing" if word.endswith("e") and not word.endswith("ee") else word + "ing"
+    return plural, past, gerund
+
+
+def _inflected(words: Dict[str, float], polarity: int) -> Dict[str, Tuple[str, float, int]]:
+    """Beugungsformen gewichteter Wörter, jeweils mit Grundform, Gewicht und Polarität"""
+    return {form: (word, weight, polarity) for word, weight in words.items() for form in _word_forms(word)}
 
 
 @dataclass
 class EmotionResult:
     """Ergebnis der Emotions-Analyse"""
+    # Kein __dict__ pro Instanz (dataclass(slots=True) erst ab Python 3.10)
+    __slots__ = ("sentence_text", "sentiment", "sentiment_score", "emotionality", "emotion_keywords")
+    
     sentence_text: str
     sentiment: str  # "positive", "negative", "neutral"
     sentiment_score: float  # -1.0 bis +1.0
@@ -24,7 +54,7 @@ class EmotionAnalyzer:
     POSITIVE_WORDS = {
         "good": 0.7, "great": 0.9, "excellent": 0.95, "wonderful": 0.9,
         "amazing": 0.95, "fantastic": 0.95, "beautiful": 0.8, "love": 0.85,
-        "brilliant": 0.9, "perfect": 0.9, "wonderful": 0.9, "awesome": 0.9,
+        "brilliant": 0.9, "perfect": 0.9, "awesome": 0.9,
         "positive": 0.8, "benefit": 0.75, "success": 0.8, "help": 0.7,
         "support": 0.75, "agree": 0.6, "right": 0.6, "true": 0.65,
         "best": 0.85, "better": 0.75, "improve": 0.8
@@ -58,9 +88,67 @@ class EmotionAnalyzer:
         "so": 1.15,
     }
     
+    # Alle Sentiment-Wörter (einmal beim Import)
+    ALL_WORDS = {**POSITIVE_WORDS, **NEGATIVE_WORDS}
+    
+    # Ein Nachschlag pro Wort: Wort -> (Grundform, Gewicht, Polarität +1/-1);
+    # auch regelmäßige Beugungsformen ("benefits", "improved", "helping"),
+    # die Grundformen haben Vorrang. Jede Grundform zählt einmal pro Satz.
+    _LEXICON = {
+        **_inflected(POSITIVE_WORDS, 1),
+        **_inflected(NEGATIVE_WORDS, -1),
+        **{word: (word, weight, 1) for word, weight in POSITIVE_WORDS.items()},
+        **{word: (word, weight, -1) for word, weight in NEGATIVE_WORDS.items()},
+    }
+    _TOKEN_RE = re.compile(r"\w+")
+    _ASCII_UPPERCASE = bytes(range(ord("A"), ord("Z") + 1))
+    
+    _init_lock = threading.RLock()  # schützt geteilte Instanz und Index-Aufbau
+    _index_owner = None  # Klasse, für die der Automat gebaut wurde
+    
     def __init__(self):
         """Initialisiert Analyzer"""
-        self.all_words = {**self.POSITIVE_WORDS, **self.NEGATIVE_WORDS}
+        self.all_words = self.ALL_WORDS
+        self._build_index()
+    
+    @classmethod
+    def instance(cls) -> "EmotionAnalyzer":
+        """Prozessweit geteilte Instanz; der Analyzer ändert keinen Zustand"""
+        if cls.__dict__.get("_shared") is None:
+            # Warm-up und Sitzungen rufen parallel auf: nur einmal bauen
+            with cls._init_lock:
+                if cls.__dict__.get("_shared") is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    @classmethod
+    def _build_index(cls):
+        """Baut Wort-IDs, Spalten und Automaten über alle Lexikon- und Intensitätswörter einmal pro Klasse"""
+        if cls._index_owner is cls:
+            return
+        with cls._init_lock:
+            if cls._index_owner is not cls:
+                cls._build_index_locked()
+    
+    @classmethod
+    def _build_index_locked(cls):
+        """Eigentlicher Aufbau von _build_index; nur unter _init_lock aufrufen"""
+        # Wort-ID pro Lexikon- und Intensitätswort, dazu Gewicht, Polarität
+        # (0 = nur Intensität) und Intensitätsfaktor (1.0 = keiner) als Spalten
+        cls._word_ids = {word: word_id for word_id, word in enumerate({**cls._LEXICON, **cls.INTENSITY_MARKERS})}
+        lexicon_entries = [cls._LEXICON.get(word, (word, 0.0, 0)) for word in cls._word_ids]
+        cls._word_weights = np.array([entry[1] for entry in lexicon_entries], dtype=np.float64)
+        cls._word_polarity = np.array([entry[2] for entry in lexicon_entries], dtype=np.int8)
+        cls._word_intensity = np.array([cls.INTENSITY_MARKERS.get(word, 1.0) for word in cls._word_ids], dtype=np.float64)
+        
+        cls._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            cls._automaton = ahocorasick.Automaton()
+            for word in cls._word_ids:
+                cls._automaton.add_word(word, (len(word), word))
+            cls._automaton.make_automaton()
+        
+        cls._index_owner = cls
     
     def analyze_emotions(self, sentences: List) -> List[EmotionResult]:
         """
@@ -70,10 +158,50 @@ class EmotionAnalyzer:
         Returns:
             Liste von EmotionResult-Objekten
         """
+        # Wortsuche pro Satz, Scoring für alle Sätze gemeinsam über Arrays
+        # (gleiche Werte wie _analyze_text)
+        n = len(sentences)
+        word_ids = self._word_ids
+        words_per_sentence = [self._scored_words(sent.text_lower) for sent in sentences]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(words) for words in words_per_sentence], out=offsets[1:])
+        hit_ids = np.fromiter(
+            (word_ids[word] for words in words_per_sentence for word in words),
+            dtype=np.int64, count=int(offsets[-1])
+        )
+        positive, negative, multiplier = score_emotion_hits(
+            hit_ids, offsets, self._word_weights, self._word_polarity, self._word_intensity
+        )
+        
+        # Großbuchstaben und Ausrufezeichen
+        shouting = np.fromiter((self._uppercase_ratio(sent.text) > 0.3 for sent in sentences), dtype=np.bool_, count=n)
+        exclamations = np.fromiter((sent.text.count("!") for sent in sentences), dtype=np.int64, count=n)
+        positive += np.where(shouting, 0.3 * multiplier, 0.0)
+        negative += np.where(shouting, 0.3 * multiplier, 0.0)
+        positive += 0.2 * exclamations
+        negative += 0.15 * exclamations
+        
+        total = positive + negative
+        scores = np.divide(positive - negative, total, out=np.zeros(n), where=total != 0)
+        emotionality = np.minimum(1.0, total / 5.0)
+        
         results = []
-        for sent in sentences:
-            result = self._analyze_sentence(sent.text)
-            results.append(result)
+        for sent, words, shout, count, score, emo in zip(
+            sentences, words_per_sentence, shouting.tolist(), exclamations.tolist(),
+            scores.tolist(), emotionality.tolist()
+        ):
+            emotion_keywords = [word for word in words if word in self._LEXICON]
+            if shout:
+                emotion_keywords.append("CAPS_LOCK")
+            if count:
+                emotion_keywords.append(f"!x{count}")
+            results.append(EmotionResult(
+                sentence_text=sent.text,
+                sentiment="positive" if score > 0.1 else "negative" if score < -0.1 else "neutral",
+                sentiment_score=score,
+                emotionality=emo,
+                emotion_keywords=emotion_keywords
+            ))
         return results
     
     def _analyze_sentence(self, text: str) -> EmotionResult:
@@ -84,33 +212,63 @@ class EmotionAnalyzer:
         Returns:
             EmotionResult
         """
-        text_lower = text.lower()
-        
+        sentiment, sentiment_score, emotionality, emotion_keywords = self._analyze_cached(text)
+        return EmotionResult(
+            sentence_text=text,
+            sentiment=sentiment,
+            sentiment_score=sentiment_score,
+            emotionality=emotionality,
+            emotion_keywords=list(emotion_keywords)
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=8192)
+    def _analyze_cached(cls, text: str) -> Tuple[str, float, float, Tuple[str, ...]]:
+        """
+        Gecachter Kern von _analyze_sentence (wiederholte Sätze, z.B. bei
+        erneuten Analysen desselben Textes)
+        Args:
+            text: Satz-Text
+        Returns:
+            (sentiment, sentiment_score, emotionality, emotion_keywords)
+        """
+        result = cls.instance()._analyze_text(text, text.lower())
+        return result.sentiment, result.sentiment_score, result.emotionality, tuple(result.emotion_keywords)
+    
+    def _analyze_text(self, text: str, text_lower: str) -> EmotionResult:
+        """
+        Analysiert einen Satz-Text, der bereits kleingeschrieben vorliegt
+        Args:
+            text: Original-Text des Satzes
+            text_lower: text.lower()
+        Returns:
+            EmotionResult
+        """
         # Zähle positive und negative Wörter
         positive_score = 0.0
         negative_score = 0.0
         emotion_keywords = []
-        intensity_multiplier = 1.0
         
-        # Suche nach Intensitätswörtern
-        for intensity_word, multiplier in self.INTENSITY_MARKERS.items():
-            if intensity_word in text_lower:
-                intensity_multiplier = max(intensity_multiplier, multiplier)
+        tokens = self._scored_words(text_lower)
+        
+        # Stärkstes Intensitätswort (1.0 = keins); wie score_emotion_hits
+        intensity = self.INTENSITY_MARKERS
+        intensity_multiplier = max([intensity.get(token, 1.0) for token in tokens], default=1.0)
         
         # Zähle emotionale Wörter
-        for word, weight in self.POSITIVE_WORDS.items():
-            if word in text_lower:
+        for token in tokens:
+            entry = self._LEXICON.get(token)
+            if entry is None:
+                continue
+            _, weight, polarity = entry
+            if polarity > 0:
                 positive_score += weight * intensity_multiplier
-                emotion_keywords.append(word)
-        
-        for word, weight in self.NEGATIVE_WORDS.items():
-            if word in text_lower:
+            else:
                 negative_score += weight * intensity_multiplier
-                emotion_keywords.append(word)
+            emotion_keywords.append(token)
         
         # Extrapunkte für Großbuchstaben (SCREAMING)
-        uppercase_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
-        if uppercase_ratio > 0.3:  # Mehr als 30% Großbuchstaben
+        if self._uppercase_ratio(text) > 0.3:  # Mehr als 30% Großbuchstaben
             emotion_keywords.append("CAPS_LOCK")
             positive_score += 0.3 * intensity_multiplier
             negative_score += 0.3 * intensity_multiplier
@@ -147,9 +305,64 @@ class EmotionAnalyzer:
             sentiment=sentiment,
             sentiment_score=sentiment_score,
             emotionality=emotionality,
-            emotion_keywords=list(set(emotion_keywords))  # Duplikate entfernen
+            emotion_keywords=emotion_keywords  # schon eindeutig (_scored_words)
         )
     
+    @classmethod
+    def _uppercase_ratio(cls, text: str) -> float:
+        """Anteil der Großbuchstaben am Satz-Text (0 bei leerem Text)"""
+        if not text:
+            return 0
+        if text.isascii():
+            # A-Z in C löschen statt isupper() pro Zeichen; gleiche Anzahl
+            return (len(text) - len(text.encode("ascii").translate(None, cls._ASCII_UPPERCASE))) / len(text)
+        return sum(1 for c in text if c.isupper()) / len(text)
+    
+    def _find_words(self, text_lower: str) -> List[str]:
+        """
+        Wörter des Satzes, jedes einmal in Textreihenfolge; nur ganze Wörter
+        ("good" nicht in "goodbye", "so" nicht in "also")
+        Args:
+            text_lower: Kleingeschriebener Satz-Text
+        Returns:
+            Mit Automat nur Lexikon- und Intensitätswörter, sonst alle Wörter
+        """
+        if self._automaton is None:
+            return list(dict.fromkeys(self._TOKEN_RE.findall(text_lower)))
+        
+        # Ein Durchlauf für das ganze Lexikon; Treffer innerhalb längerer
+        # Wörter verwerfen (Wortgrenzen wie \b)
+        words = {}
+        last = len(text_lower) - 1
+        for end, (length, word) in self._automaton.iter(text_lower):
+            start = end - length + 1
+            if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] == "_"):
+                continue
+            if end < last and (text_lower[end + 1].isalnum() or text_lower[end + 1] == "_"):
+                continue
+            words[word] = None
+        return list(words)
+    
+    def _scored_words(self, text_lower: str) -> List[str]:
+        """
+        Lexikon- und Intensitätswörter des Satzes in Textreihenfolge, pro
+        Grundform nur die erste Form ("benefit" und "benefits" zählen einmal)
+        Args:
+            text_lower: Kleingeschriebener Satz-Text
+        Returns:
+            Wörter, wie sie im Text stehen
+        """
+        lexicon = self._LEXICON
+        intensity = self.INTENSITY_MARKERS
+        words = {}
+        for word in self._find_words(text_lower):
+            entry = lexicon.get(word)
+            if entry is not None:
+                words.setdefault(entry[0], word)
+            elif word in intensity:
+                words.setdefault(word, word)
+        return list(words.values())
+    
     def get_emotional_sentences(self, results: List[EmotionResult], threshold: float = 0.5) -> List[EmotionResult]:
         """
         Filtert stark emotionale Sätze
@@ -172,18 +385,20 @@ class EmotionAnalyzer:
         if not results:
             return {"positive": 0, "negative": 0, "neutral": 0, "avg_sentiment": 0.0}
         
-        positive_count = sum(1 for r in results if r.sentiment == "positive")
-        negative_count = sum(1 for r in results if r.sentiment == "negative")
-        neutral_count = sum(1 for r in results if r.sentiment == "neutral")
-        avg_sentiment = sum(r.sentiment_score for r in results) / len(results)
-        avg_emotionality = sum(r.emotionality for r in results) / len(results)
+        # Ein Durchlauf statt fünf; Summen in derselben Reihenfolge wie sum()
+        counts = {"positive": 0, "negative": 0, "neutral": 0}
+        sum_sentiment = 0.0
+        sum_emotionality = 0.0
+        for r in results:
+            if r.sentiment in counts:
+                counts[r.sentiment] += 1
+            sum_sentiment += r.sentiment_score
+            sum_emotionality += r.emotionality
         
         return {
-            "positive": positive_count,
-            "negative": negative_count,
-            "neutral": neutral_count,
-            "avg_sentiment": avg_sentiment,
-            "avg_emotionality": avg_emotionality,
+            **counts,
+            "avg_sentiment": sum_sentiment / len(results),
+            "avg_emotionality": sum_emotionality / len(results),
             "total_sentences": len(results)
         }
 
@@ -209,8 +424,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     for result in results:
-        emotion_icon = "😊" if result.sentiment == "positive" else \
-                      "😠" if result.sentiment == "negative" else "😐"
+        emotion_icon = _ICONS.get(result.sentiment, "😐")
         
         print(f"\n{emotion_icon} {result.sentiment.upper()} (score: {result.sentiment_score:+.2f})")
         print(f"   Emotionality: {result.emotionality:.2f} | Keywords: {result.emotion_keywords}")
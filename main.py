@@ -51,14 +51,14 @@ def main(text: str = None, verbose: bool = True):
     # 1. PREPROCESSING
     # ============================================
     print("\n\n⚙️  Processing text...")
-    processor = TextPreprocessor()
+    processor = TextPreprocessor.instance()
     sentences = processor.process_text(text)
     print(f"   ✓ Found {len(sentences)} sentences")
     
     # ============================================
     # 2. EMOTION ANALYSIS
     # ============================================
-    emotion_analyzer = EmotionAnalyzer()
+    emotion_analyzer = EmotionAnalyzer.instance()
     emotion_results = emotion_analyzer.analyze_emotions(sentences)
     emotion_summary = emotion_analyzer.get_sentiment_summary(emotion_results)
     
@@ -66,7 +66,7 @@ def main(text: str = None, verbose: bool = True):
     # 3. ARGUMENT CLASSIFICATION
     # ============================================
     classifier = ArgumentClassifier()
-    classifications = classifier.classify_arguments(sentences)
+    classifications = classifier.classify_arguments(sentences, emotion_results)
     argument_summary = classifier.get_argument_summary(classifications)
     
     # ============================================
@@ -0,0 +1,319 @@
+"""
+Numeric Kernels Module: Kompilierte Schleifen über spaltenweise Analyse-Daten
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except (ImportError, Exception):
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback ohne Numba: Funktion bleibt reines Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _type_summary_jit(type_codes, strength, n_types):
+    counts = np.zeros(n_types, dtype=np.int64)
+    sums = np.zeros(n_types, dtype=np.float64)
+    for i in range(type_codes.size):
+        code = type_codes[i]
+        counts[code] += 1
+        sums[code] += strength[i]
+    return counts, sums
+
+
+@njit(cache=True)
+def _filter_mask_jit(type_codes, confidence, allowed, min_confidence):
+    keep = np.empty(type_codes.size, dtype=np.bool_)
+    for i in range(type_codes.size):
+        # Bitweises & statt "and": keine Verzweigung, Schleife bleibt vektorisierbar
+        keep[i] = allowed[type_codes[i]] & (confidence[i] >= min_confidence)
+    return keep
+
+
+@njit(cache=True)
+def _group_means_jit(type_codes, confidence, strength, emotionality, n_types):
+    counts = np.zeros(n_types, dtype=np.int64)
+    means = np.zeros((n_types, 3), dtype=np.float64)
+    for i in range(type_codes.size):
+        code = type_codes[i]
+        counts[code] += 1
+        means[code, 0] += confidence[i]
+        means[code, 1] += strength[i]
+        means[code, 2] += emotionality[i]
+    for code in range(n_types):
+        if counts[code] > 0:
+            means[code, :] /= counts[code]
+    return means
+
+
+@njit(cache=True)
+def _group_stats_jit(type_codes, values, n_types):
+    counts = np.zeros(n_types, dtype=np.int64)
+    stats = np.full((n_types, 4), np.nan)
+    m2 = np.zeros(n_types, dtype=np.float64)
+    for i in range(type_codes.size):
+        code = type_codes[i]
+        value = values[i]
+        counts[code] += 1
+        if counts[code] == 1:
+            stats[code, 0] = value
+            stats[code, 1] = value
+            stats[code, 2] = value
+            continue
+        # Welford: laufender Mittelwert und Summe der Abweichungsquadrate
+        delta = value - stats[code, 0]
+        stats[code, 0] += delta / counts[code]
+        m2[code] += delta * (value - stats[code, 0])
+        stats[code, 1] = min(stats[code, 1], value)
+        stats[code, 2] = max(stats[code, 2], value)
+    for code in range(n_types):
+        if counts[code] > 1:
+            stats[code, 3] = np.sqrt(m2[code] / (counts[code] - 1))
+    return stats
+
+
+@njit(cache=True)
+def _score_marker_hits_jit(hit_ids, offsets, marker_type_ids, marker_confs, n_types):
+    n = offsets.size - 1
+    best = np.full(n, -1, dtype=np.int64)
+    best_conf = np.zeros(n, dtype=np.float64)
+    sums = np.zeros(n_types, dtype=np.float64)
+    counts = np.zeros(n_types, dtype=np.int64)
+    for s in range(n):
+        sums[:] = 0.0
+        counts[:] = 0
+        for h in range(offsets[s], offsets[s + 1]):
+            marker = hit_ids[h]
+            sums[marker_type_ids[marker]] += marker_confs[marker]
+            counts[marker_type_ids[marker]] += 1
+        for t in range(n_types):
+            if counts[t] > 0:
+                avg = sums[t] / counts[t]
+                if avg > best_conf[s]:
+                    best_conf[s] = avg
+                    best[s] = t
+    return best, best_conf
+
+
+# Bewusst ohne parallel=True: Streamlit ruft die Kernels aus mehreren
+# Threads auf, und der TBB-Threading-Layer blockiert dann das Beenden
+# des Interpreters
+@njit(cache=True)
+def _score_emotion_hits_jit(hit_ids, offsets, word_weights, word_polarity, word_intensity):
+    n = offsets.size - 1
+    positive = np.zeros(n, dtype=np.float64)
+    negative = np.zeros(n, dtype=np.float64)
+    multiplier = np.ones(n, dtype=np.float64)
+    for s in range(n):
+        for h in range(offsets[s], offsets[s + 1]):
+            multiplier[s] = max(multiplier[s], word_intensity[hit_ids[h]])
+        for h in range(offsets[s], offsets[s + 1]):
+            word = hit_ids[h]
+            if word_polarity[word] > 0:
+                positive[s] += word_weights[word] * multiplier[s]
+            elif word_polarity[word] < 0:
+                negative[s] += word_weights[word] * multiplier[s]
+    return positive, negative, multiplier
+
+
+@njit(cache=True)
+def _max_tree_depth_jit(parents, is_root):
+    depth = np.zeros(parents.size, dtype=np.int64)
+    best = 0
+    for i in range(parents.size):
+        parent = parents[i]
+        if parent >= 0:
+            if depth[parent] > 0:
+                depth[i] = depth[parent] + 1
+        elif is_root[i]:
+            depth[i] = 1
+        best = max(best, depth[i])
+    return best
+
+
+def type_summary(type_codes: np.ndarray, strength: np.ndarray, n_types: int):
+    """
+    Anzahl und Stärke-Summe pro Argumenttyp in einem Durchlauf
+    Args:
+        type_codes: int8-Array der Typ-Codes
+        strength: float64-Array der Stärken
+        n_types: Anzahl möglicher Typ-Codes
+    Returns:
+        (counts, strength_sums) als Arrays der Länge n_types
+    """
+    if NUMBA_AVAILABLE:
+        return _type_summary_jit(type_codes, strength, n_types)
+    counts = np.bincount(type_codes, minlength=n_types)
+    sums = np.bincount(type_codes, weights=strength, minlength=n_types)
+    return counts, sums
+
+
+def filter_mask(type_codes: np.ndarray, confidence: np.ndarray, allowed: np.ndarray, min_confidence: float) -> np.ndarray:
+    """
+    Maske der Argumente mit erlaubtem Typ und ausreichender Confidence
+    Args:
+        type_codes: int8-Array der Typ-Codes
+        confidence: float64-Array der Confidences
+        allowed: bool-Array, indiziert über den Typ-Code
+        min_confidence: Minimale Confidence
+    Returns:
+        bool-Array, True = anzeigen
+    """
+    if NUMBA_AVAILABLE:
+        return _filter_mask_jit(type_codes, confidence, allowed, float(min_confidence))
+    return allowed[type_codes] & (confidence >= min_confidence)
+
+
+def group_means(type_codes: np.ndarray, confidence: np.ndarray, strength: np.ndarray,
+                emotionality: np.ndarray, n_types: int) -> np.ndarray:
+    """
+    Mittelwerte von Confidence, Stärke und Emotionalität pro Argumenttyp
+    Args:
+        type_codes: int8-Array der Typ-Codes
+        confidence: float64-Array der Confidences
+        strength: float64-Array der Stärken
+        emotionality: float64-Array der Emotionalität
+        n_types: Anzahl möglicher Typ-Codes
+    Returns:
+        float64-Array (n_types, 3); Typen ohne Argumente bleiben 0
+    """
+    if NUMBA_AVAILABLE:
+        return _group_means_jit(type_codes, confidence, strength, emotionality, n_types)
+    counts = np.bincount(type_codes, minlength=n_types)
+    sums = np.stack([
+        np.bincount(type_codes, weights=values, minlength=n_types)
+        for values in (confidence, strength, emotionality)
+    ], axis=1)
+    return sums / np.maximum(counts, 1)[:, None]
+
+
+def group_stats(type_codes: np.ndarray, values: np.ndarray, n_types: int) -> np.ndarray:
+    """
+    Mittelwert, Minimum, Maximum und Standardabweichung pro Argumenttyp
+    Args:
+        type_codes: int8-Array der Typ-Codes
+        values: float64-Array der Kennzahl
+        n_types: Anzahl möglicher Typ-Codes
+    Returns:
+        float64-Array (n_types, 4) mit Spalten mean, min, max, std
+        (Stichproben-Std wie pandas; NaN ohne bzw. mit nur einem Wert)
+    """
+    if NUMBA_AVAILABLE:
+        return _group_stats_jit(type_codes, values, n_types)
+    stats = np.full((n_types, 4), np.nan)
+    order = np.argsort(type_codes, kind="stable")
+    codes, starts, counts = np.unique(type_codes[order], return_index=True, return_counts=True)
+    for code, group in zip(codes, np.split(values[order], starts[1:])):
+        stats[code, :3] = group.mean(), group.min(), group.max()
+        if group.size > 1:
+            stats[code, 3] = group.std(ddof=1)
+    return stats
+
+
+def score_marker_hits(hit_ids: np.ndarray, offsets: np.ndarray, marker_type_ids: np.ndarray,
+                      marker_confs: np.ndarray, n_types: int):
+    """
+    Bester Marker-Typ pro Satz: höchster Durchschnitt der Marker-Confidences
+    Args:
+        hit_ids: int64-Array der gefundenen Marker-IDs aller Sätze (CSR)
+        offsets: int64-Array (Sätze + 1), Treffer von Satz s in
+            hit_ids[offsets[s]:offsets[s + 1]]
+        marker_type_ids: int8-Array, Typ-Index pro Marker-ID
+        marker_confs: float64-Array, Confidence pro Marker-ID
+        n_types: Anzahl der Marker-Typen
+    Returns:
+        (best_type, confidence) pro Satz; best_type -1 = kein Treffer.
+        Bei Gleichstand gewinnt der kleinere Typ-Index.
+    """
+    if NUMBA_AVAILABLE:
+        return _score_marker_hits_jit(hit_ids, offsets, marker_type_ids, marker_confs, n_types)
+    n = offsets.size - 1
+    sentence_ids = np.repeat(np.arange(n), np.diff(offsets))
+    bins = sentence_ids * n_types + marker_type_ids[hit_ids]
+    sums = np.bincount(bins, weights=marker_confs[hit_ids], minlength=n * n_types).reshape(n, n_types)
+    counts = np.bincount(bins, minlength=n * n_types).reshape(n, n_types)
+    averages = sums / np.maximum(counts, 1)
+    # argmax liefert bei Gleichstand den ersten Index
+    best = averages.argmax(axis=1)
+    best_conf = averages[np.arange(n), best]
+    return np.where(best_conf > 0.0, best, -1), best_conf
+
+
+def score_emotion_hits(hit_ids: np.ndarray, offsets: np.ndarray, word_weights: np.ndarray,
+                       word_polarity: np.ndarray, word_intensity: np.ndarray):
+    """
+    Positive und negative Wortsummen pro Satz, gewichtet mit dem höchsten
+    Intensitätsfaktor des Satzes
+    Args:
+        hit_ids: int64-Array der gefundenen Wort-IDs aller Sätze (CSR)
+        offsets: int64-Array (Sätze + 1), Treffer von Satz s in
+            hit_ids[offsets[s]:offsets[s + 1]]
+        word_weights: float64-Array, Gewicht pro Wort-ID
+        word_polarity: int8-Array, +1/-1 pro Wort-ID (0 = nur Intensität)
+        word_intensity: float64-Array, Intensitätsfaktor pro Wort-ID (1.0 = keiner)
+    Returns:
+        (positive, negative, multiplier) als float64-Arrays pro Satz;
+        Summen in Trefferreihenfolge
+    """
+    if NUMBA_AVAILABLE:
+        return _score_emotion_hits_jit(hit_ids, offsets, word_weights, word_polarity, word_intensity)
+    n = offsets.size - 1
+    sentence_ids = np.repeat(np.arange(n), np.diff(offsets))
+    multiplier = np.ones(n)
+    np.maximum.at(multiplier, sentence_ids, word_intensity[hit_ids])
+    # ufunc.at addiert ungepuffert in Trefferreihenfolge
+    weighted = word_weights[hit_ids] * multiplier[sentence_ids]
+    polarity = word_polarity[hit_ids]
+    positive = np.zeros(n)
+    negative = np.zeros(n)
+    np.add.at(positive, sentence_ids, np.where(polarity > 0, weighted, 0.0))
+    np.add.at(negative, sentence_ids, np.where(polarity < 0, weighted, 0.0))
+    return positive, negative, multiplier
+
+
+def max_tree_depth(parents: np.ndarray, is_root: np.ndarray) -> int:
+    """
+    Tiefe des tiefsten Baums über ein Parent-Array
+    Args:
+        parents: int32-Array, Parent-ID pro Knoten (-1 = keiner); Parents
+            stehen vor ihren Kindern (Textreihenfolge)
+        is_root: bool-Array, True = Wurzel eines Baums
+    Returns:
+        Anzahl Ebenen (Wurzel = 1); 0 ohne Wurzeln. Knoten ohne Wurzel
+        darüber zählen nicht.
+    """
+    if NUMBA_AVAILABLE:
+        return int(_max_tree_depth_jit(parents, is_root))
+    depth = is_root.astype(np.int64)
+    attached = parents >= 0
+    parent_ids = np.maximum(parents, 0)
+    # Ebene für Ebene nach unten propagieren, bis sich nichts mehr ändert
+    for _ in range(parents.size):
+        parent_depth = np.where(attached, depth[parent_ids], 0)
+        updated = np.where(parent_depth > 0, parent_depth + 1, depth)
+        if np.array_equal(updated, depth):
+            break
+        depth = updated
+    return int(depth.max()) if depth.size else 0
+
+
+def warmup():
+    """Kompiliert (bzw. lädt aus dem Cache) alle Kernels vorab"""
+    if not NUMBA_AVAILABLE:
+        return
+    codes = np.zeros(1, dtype=np.int8)
+    values = np.zeros(1, dtype=np.float64)
+    type_summary(codes, values, 1)
+    filter_mask(codes, values, np.ones(1, dtype=np.bool_), 0.0)
+    group_means(codes, values, values, values, 1)
+    group_stats(codes, values, 1)
+    score_marker_hits(np.zeros(1, dtype=np.int64), np.array([0, 1], dtype=np.int64), codes, values, 1)
+    score_emotion_hits(np.zeros(1, dtype=np.int64), np.array([0, 1], dtype=np.int64), values, codes, values)
+    max_tree_depth(np.full(1, -1, dtype=np.int32), np.ones(1, dtype=np.bool_))
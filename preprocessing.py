@@ -10,11 +10,17 @@ except (ImportError, Exception):
 
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
+import re
+import threading
+import numpy as np
 
 
 @dataclass
 class Token:
     """Datenstruktur für Token mit Metadaten"""
+    # Kein __dict__ pro Token (dataclass(slots=True) erst ab Python 3.10)
+    __slots__ = ("text", "pos", "lemma", "dep")
+    
     text: str
     pos: str  # POS-Tag
     lemma: str  # Lemma
@@ -24,14 +30,31 @@ class Token:
 @dataclass
 class Sentence:
     """Datenstruktur für Satz mit Tokens"""
+    # text_lower: einmal kleingeschrieben für alle nachgelagerten Analysen;
+    # nur Slot, kein Dataclass-Feld (Slots vertragen keine Feld-Defaults)
+    __slots__ = ("text", "tokens", "doc_id", "text_lower")
+    
     text: str
     tokens: List[Token]
     doc_id: int  # Satz-Index im Dokument
+    
+    def __post_init__(self):
+        self.text_lower = self.text.lower()
 
 
 class TextPreprocessor:
     """Verarbeitet Rohtexte für Analyse"""
     
+    # Fallback: Satzenden als Codepoints, Wortmuster einmal kompiliert
+    _TERMINATORS = (ord("."), ord("!"), ord("?"))
+    _WORD_RE = re.compile(r'\w+')
+    
+    # Pipeline-Komponenten, die die Satzanalyse nicht braucht (NER nur für
+    # extract_entities, das die volle Pipeline nutzt)
+    _SKIP_PIPES = ("ner",)
+    
+    _init_lock = threading.Lock()  # schützt die geteilte Instanz
+    
     def __init__(self, model: str = "en_core_web_sm"):
         """
         Initialisiert TextPreprocessor (mit Fallback)
@@ -52,6 +75,16 @@ class TextPreprocessor:
             print(f"⚠️  spaCy ist nicht installiert")
             print(f"   Nutze Fallback-Tokenizer (Regex-basiert)")
     
+    @classmethod
+    def instance(cls) -> "TextPreprocessor":
+        """Prozessweit geteilte Instanz mit Standardmodell (spaCy nur einmal laden)"""
+        if cls.__dict__.get("_shared") is None:
+            # Warm-up und Sitzungen rufen parallel auf: nur einmal bauen
+            with cls._init_lock:
+                if cls.__dict__.get("_shared") is None:
+                    cls._shared = cls()
+        return cls._shared
+    
     def process_text(self, text: str) -> List[Sentence]:
         """
         Verarbeitet Text in Sätze und Tokens
@@ -65,9 +98,26 @@ class TextPreprocessor:
         else:
             return self._process_with_fallback(text)
     
+    def process_texts(self, texts: List[str], batch_size: int = 32) -> List[List[Sentence]]:
+        """
+        Verarbeitet mehrere Texte (mit spaCy gebündelt über nlp.pipe)
+        Args:
+            texts: Eingabe-Texte
+            batch_size: Texte pro spaCy-Batch
+        Returns:
+            Pro Text die Liste seiner Sentence-Objekte
+        """
+        if self.nlp:
+            docs = self.nlp.pipe(texts, batch_size=batch_size, disable=list(self._SKIP_PIPES))
+            return [self._sentences_from_doc(doc) for doc in docs]
+        return [self._process_with_fallback(text) for text in texts]
+    
     def _process_with_spacy(self, text: str) -> List[Sentence]:
         """Nutzt spaCy für Verarbeitung"""
-        doc = self.nlp(text)
+        return self._sentences_from_doc(self.nlp(text, disable=list(self._SKIP_PIPES)))
+    
+    def _sentences_from_doc(self, doc) -> List[Sentence]:
+        """Wandelt ein spaCy-Doc in Sentence-Objekte"""
         sentences = []
         
         for sent_idx, sent in enumerate(doc.sents):
@@ -92,21 +142,20 @@ class TextPreprocessor:
     
     def _process_with_fallback(self, text: str) -> List[Sentence]:
         """Fallback-Tokenizer (einfache Regex-basierte Sätze)"""
-        import re
-        
-        # Einfache Satz-Segmentierung
-        sentence_pattern = r'[^.!?]*[.!?]'
-        sent_texts = re.findall(sentence_pattern, text)
-        
         sentences = []
-        for sent_idx, sent_text in enumerate(sent_texts):
-            sent_text = sent_text.strip()
+        # Einfache Satz-Segmentierung: jeder Satz endet an . ! ? (Rest ohne
+        # Satzzeichen entfällt); alle Enden in einem Vektor-Durchlauf, UTF-32
+        # hält die Positionen deckungsgleich mit den str-Indizes
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        ends = np.flatnonzero(np.isin(codes, self._TERMINATORS)) + 1
+        starts = np.concatenate((np.zeros(1, dtype=ends.dtype), ends[:-1]))
+        for sent_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            sent_text = text[start:end].strip()
             if not sent_text:
                 continue
             
             # Einfache Tokenisierung
-            word_pattern = r'\w+'
-            word_tokens = re.findall(word_pattern, sent_text.lower())
+            word_tokens = self._WORD_RE.findall(sent_text.lower())
             
             tokens = []
             for word in word_tokens:
@@ -133,16 +182,17 @@ class TextPreprocessor:
         Args:
             sentence: Satz-Objekt
         Returns:
-            Dictionary mit Struktur
+            Dictionary mit einer Liste pro Feld ("text", "pos", "dep",
+            "lemma"), Index = Token-Position; wiederholte Wörter bleiben
+            einzeln erhalten
         """
-        tree = {}
-        for token in sentence.tokens:
-            tree[token.text] = {
-                "pos": token.pos,
-                "dep": token.dep,
-                "lemma": token.lemma
-            }
-        return tree
+        tokens = sentence.tokens
+        return {
+            "text": [token.text for token in tokens],
+            "pos": [token.pos for token in tokens],
+            "dep": [token.dep for token in tokens],
+            "lemma": [token.lemma for token in tokens],
+        }
     
     def extract_verbs(self, sentence: Sentence) -> List[str]:
         """
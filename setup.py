@@ -19,6 +19,7 @@ setup(
         "argument_classification",
         "structure_builder",
         "visualizer",
+        "numeric_kernels",
         "main",
         "app",
     ],
@@ -45,6 +46,11 @@ setup(
         "scikit-learn>=1.3.0",
     ],
     extras_require={
+        "speed": [
+            "numba>=0.57.0",
+            "orjson>=3.9.0",
+            "pyahocorasick>=2.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.1.0",
@@ -2,30 +2,68 @@
 Structure Builder Module: Baut Argument-Graph und Struktur
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
 from argument_classification import ArgumentClassification
+from numeric_kernels import max_tree_depth, type_summary
+
+
+class ArgType(IntEnum):
+    """Argumenttyp als Int-Code: Vergleiche ohne String-Hashing, Tupel-Index für Icons"""
+    CLAIM = 0
+    SUPPORT = 1
+    COUNTER = 2
+    NEUTRAL = 3
+
+
+# Icons indiziert über ArgType
+_ICONS = ("🟢", "🔵", "🟣", "⚪")
+
+# Verbinder und Einrückung des ASCII-Baums (letztes / weiteres Geschwister)
+_CONN_LAST = "└── "
+_CONN_MID = "├── "
+_EXT_LAST = "    "
+_EXT_MID = "│   "
 
 
 @dataclass
 class ArgumentNode:
     """Knoten in der Argument-Struktur"""
+    # Kein __dict__ pro Knoten (dataclass(slots=True) erst ab Python 3.10).
+    # Baum-Verknüpfungen nur als Slots, keine Dataclass-Felder (Slots
+    # vertragen keine Feld-Defaults): children, parent, depth (Root = 1),
+    # strongest_child
+    __slots__ = ("id", "text", "arg_type", "strength", "emotionality",
+                 "children", "parent", "depth", "strongest_child")
+    
     id: int
     text: str
-    arg_type: str  # CLAIM, SUPPORT, COUNTER, NEUTRAL
+    arg_type: ArgType
     strength: float
     emotionality: float
-    children: List['ArgumentNode'] = field(default_factory=list)
-    parent: Optional['ArgumentNode'] = None
+    
+    def __post_init__(self):
+        self.children: List['ArgumentNode'] = []
+        self.parent: Optional['ArgumentNode'] = None
+        self.depth = 1
+        self.strongest_child: Optional['ArgumentNode'] = None
     
     def add_child(self, child: 'ArgumentNode'):
         """Fügt Child-Node hinzu"""
         self.children.append(child)
         child.parent = self
+        child.depth = self.depth + 1
+        # Bei Gleichstand bleibt das erste Kind (wie max())
+        if self.strongest_child is None or child.strength > self.strongest_child.strength:
+            self.strongest_child = child
     
     def __str__(self) -> str:
-        """String-Repräsentation"""
-        return f"[{self.arg_type}] {self.text[:50]}..."
+        """String-Repräsentation, Text ab 50 Zeichen gekürzt"""
+        text = self.text
+        snippet = text if len(text) <= 50 else f"{text[:50]}..."
+        return f"[{self.arg_type.name}] {snippet}"
 
 
 class StructureBuilder:
@@ -35,6 +73,19 @@ class StructureBuilder:
         """Initialisiert Builder"""
         self.nodes: List[ArgumentNode] = []
         self.root_claims: List[ArgumentNode] = []
+        # Spaltenweise Kopien pro Knoten-ID (Typ-Code, Stärke, Parent-ID
+        # bzw. -1) für vektorisierte Abfragen ohne Objekt-Zugriffe
+        self.type_codes = np.empty(0, dtype=np.int8)
+        self.strengths = np.empty(0, dtype=np.float64)
+        self.parents = np.empty(0, dtype=np.int32)
+        # Beim Aufbau berechnet, damit get_tree_stats nicht erneut scannt
+        self._type_counts = np.zeros(len(ArgType), dtype=np.int64)
+        self._strength_sum = 0.0
+        self._max_depth = 0
+        self.strongest_root: Optional[ArgumentNode] = None
+        # Tree-Dicts pro Root-ID, gültig bis zum nächsten build_structure
+        self._tree_dicts: Dict[int, Dict] = {}
+        self._counter_pairs: List[Tuple[ArgumentNode, ArgumentNode]] = []
     
     def build_structure(self, classifications: List[ArgumentClassification]) -> List[ArgumentNode]:
         """
@@ -52,103 +103,131 @@ class StructureBuilder:
         Returns:
             Liste von Root-Knoten (Claims)
         """
-        # Erstelle Nodes
-        nodes = []
-        for idx, cls in enumerate(classifications):
-            node = ArgumentNode(
-                id=idx,
-                text=cls.sentence_text,
-                arg_type=cls.argument_type,
-                strength=cls.strength,
-                emotionality=cls.emotionality
-            )
-            nodes.append(node)
+        # Erstelle Nodes (Comprehension mit Positionsargumenten)
+        nodes = [
+            ArgumentNode(idx, c.sentence_text, ArgType[c.argument_type], c.strength, c.emotionality)
+            for idx, c in enumerate(classifications)
+        ]
         
-        # Identifiziere Hauptclaims
-        claims = [n for n in nodes if n.arg_type == "CLAIM"]
-        supports = [n for n in nodes if n.arg_type == "SUPPORT"]
-        counters = [n for n in nodes if n.arg_type == "COUNTER"]
+        n = len(nodes)
+        type_codes = np.fromiter((node.arg_type for node in nodes), dtype=np.int8, count=n)
+        strengths = np.fromiter((node.strength for node in nodes), dtype=np.float64, count=n)
+        parents = np.full(n, -1, dtype=np.int32)
+        
+        # Ein Durchlauf: Supports und Counters gehören zum letzten Claim davor
+        claims = []
+        supports = []
+        counter_pairs = []
+        current_claim = None
+        for node in nodes:
+            if node.arg_type == ArgType.CLAIM:
+                claims.append(node)
+                current_claim = node
+            elif node.arg_type == ArgType.SUPPORT or node.arg_type == ArgType.COUNTER:
+                if node.arg_type == ArgType.SUPPORT:
+                    supports.append(node)
+                if current_claim is not None:
+                    current_claim.add_child(node)
+                    parents[node.id] = current_claim.id
+                    if node.arg_type == ArgType.COUNTER:
+                        counter_pairs.append((current_claim, node))
         
         # Wenn keine expliziten Claims, nutze stärksten Support als Claim
+        # und hänge alle späteren Supports und Counters an ihn
         if not claims and supports:
             strongest = max(supports, key=lambda n: n.strength)
             claims = [strongest]
-        
-        # Baue einfache Struktur: Claims bekommen Supports und Counters
-        # (MVP: Naive nearest-neighbor Zuordnung)
-        for claim in claims:
-            # Assign Supports zum nächstgelegenen Claim
-            for support in supports:
-                # Einfache Heuristik: Positionen im Original-Text
-                if support.id > claim.id:
-                    claim.add_child(support)
-            
-            # Assign Counters zum nächstgelegenen Claim
-            for counter in counters:
-                if counter.id > claim.id:
-                    claim.add_child(counter)
+            for node in nodes[strongest.id + 1:]:
+                if node.arg_type == ArgType.SUPPORT or node.arg_type == ArgType.COUNTER:
+                    strongest.add_child(node)
+                    parents[node.id] = strongest.id
+                    if node.arg_type == ArgType.COUNTER:
+                        counter_pairs.append((strongest, node))
         
         self.nodes = nodes
         self.root_claims = claims
+        self._tree_dicts = {}
+        self._counter_pairs = counter_pairs
+        self.type_codes = type_codes
+        self.strengths = strengths
+        self.parents = parents
+        self._type_counts, strength_sums = type_summary(type_codes, strengths, len(ArgType))
+        self._strength_sum = float(strength_sums.sum())
+        is_root = np.zeros(n, dtype=np.bool_)
+        is_root[[claim.id for claim in claims]] = True
+        self._max_depth = max_tree_depth(parents, is_root)
+        self.strongest_root = max(claims, key=lambda n: n.strength) if claims else None
         
         return claims
     
     def get_argument_tree_dict(self, root: ArgumentNode, depth: int = 0) -> Dict:
         """
         Konvertiert Argument-Node zu Dictionary (für Visualisierung)
+        Knoten der aktuellen Struktur werden bis zum nächsten build_structure
+        zwischengespeichert; das Ergebnis ist geteilt und nicht zu verändern.
         Args:
             root: Root-Node
-            depth: Aktuelle Tiefe (für Rekursion)
+            depth: Aktuelle Tiefe (ungenutzt, nur aus Kompatibilität)
         Returns:
             Dictionary-Repräsentation
         """
+        in_structure = root.id < len(self.nodes) and self.nodes[root.id] is root
+        if in_structure and root.id in self._tree_dicts:
+            return self._tree_dicts[root.id]
+        
+        # Iterativ mit eigenem Stack statt Rekursion: kein RecursionError bei tiefen Bäumen
+        tree = self._node_dict(root)
+        stack = [(root, tree)]
+        while stack:
+            node, entry = stack.pop()
+            for child in node.children:
+                child_entry = self._node_dict(child)
+                entry["children"].append(child_entry)
+                stack.append((child, child_entry))
+        if in_structure:
+            self._tree_dicts[root.id] = tree
+        return tree
+    
+    @staticmethod
+    def _node_dict(node: ArgumentNode) -> Dict:
+        """Dictionary eines einzelnen Knotens, Kinder werden nachgetragen"""
         return {
-            "id": root.id,
-            "type": root.arg_type,
-            "text": root.text,
-            "strength": root.strength,
-            "emotionality": root.emotionality,
-            "children": [
-                self.get_argument_tree_dict(child, depth + 1)
-                for child in root.children
-            ]
+            "id": node.id,
+            "type": node.arg_type.name,
+            "text": node.text,
+            "strength": node.strength,
+            "emotionality": node.emotionality,
+            "children": []
         }
     
     def get_tree_stats(self) -> Dict:
         """
-        Gibt Statistiken über die Argument-Struktur
+        Gibt Statistiken über die Argument-Struktur (Stand nach build_structure)
         Returns:
             Dictionary mit Stats
         """
         total_nodes = len(self.nodes)
-        total_claims = sum(1 for n in self.nodes if n.arg_type == "CLAIM")
-        total_supports = sum(1 for n in self.nodes if n.arg_type == "SUPPORT")
-        total_counters = sum(1 for n in self.nodes if n.arg_type == "COUNTER")
-        
-        # Durchschnittliche Stärke
-        avg_strength = sum(n.strength for n in self.nodes) / total_nodes if total_nodes > 0 else 0
-        
-        # Tiefe des tiefesten Baums
-        max_depth = 0
-        for claim in self.root_claims:
-            depth = self._calculate_depth(claim)
-            max_depth = max(max_depth, depth)
+        avg_strength = self._strength_sum / total_nodes if total_nodes > 0 else 0
         
         return {
             "total_nodes": total_nodes,
-            "total_claims": total_claims,
-            "total_supports": total_supports,
-            "total_counters": total_counters,
+            "total_claims": int(self._type_counts[ArgType.CLAIM]),
+            "total_supports": int(self._type_counts[ArgType.SUPPORT]),
+            "total_counters": int(self._type_counts[ArgType.COUNTER]),
             "avg_strength": avg_strength,
-            "max_depth": max_depth,
+            "max_depth": self._max_depth,
             "num_root_claims": len(self.root_claims)
         }
     
     def _calculate_depth(self, node: ArgumentNode) -> int:
         """Berechnet Tiefe eines Knoten-Subtrags"""
-        if not node.children:
-            return 1
-        return 1 + max(self._calculate_depth(child) for child in node.children)
+        max_depth = 0
+        stack = [(node, 1)]
+        while stack:
+            current, depth = stack.pop()
+            max_depth = max(max_depth, depth)
+            stack.extend((child, depth + 1) for child in current.children)
+        return max_depth
     
     def get_strongest_path(self) -> List[ArgumentNode]:
         """
@@ -156,34 +235,25 @@ class StructureBuilder:
         Returns:
             Liste von Nodes vom Root zum tiefsten starken Argument
         """
-        if not self.root_claims:
+        if self.strongest_root is None:
             return []
         
-        # Stärkster Root-Claim
-        strongest_root = max(self.root_claims, key=lambda n: n.strength)
-        path = [strongest_root]
-        
-        # Folge dem stärksten Kind
-        current = strongest_root
-        while current.children:
-            strongest_child = max(current.children, key=lambda n: n.strength)
-            path.append(strongest_child)
-            current = strongest_child
+        # Stärkster Root-Claim, dann jeweils dem stärksten Kind folgen
+        node = self.strongest_root
+        path = [node]
+        while node.strongest_child is not None:
+            node = node.strongest_child
+            path.append(node)
         
         return path
     
     def get_counterargument_pairs(self) -> List[tuple]:
         """
-        Findet Claim-Counter-Paare
+        Findet Claim-Counter-Paare (beim Aufbau gesammelt)
         Returns:
             Liste von (Claim, Counter) Tupel
         """
-        pairs = []
-        for claim in self.root_claims:
-            for child in claim.children:
-                if child.arg_type == "COUNTER":
-                    pairs.append((claim, child))
-        return pairs
+        return list(self._counter_pairs)
     
     def visualize_ascii(self) -> str:
         """
@@ -191,14 +261,13 @@ class StructureBuilder:
         Returns:
             String mit ASCII-Baum
         """
-        output = []
-        for claim in self.root_claims:
-            output.append(self._build_ascii_tree(claim))
-        return "\n".join(output)
+        # Alle Bäume in eine Zeilenliste, nur ein join am Ende
+        roots = [(claim, "", True) for claim in reversed(self.root_claims)]
+        return "\n".join(self._ascii_lines(roots))
     
     def _build_ascii_tree(self, node: ArgumentNode, prefix: str = "", is_last: bool = True) -> str:
         """
-        Rekursiv ASCII-Baum bauen
+        ASCII-Baum eines Knotens bauen
         Args:
             node: Node
             prefix: Präfix für Indentation
@@ -206,23 +275,34 @@ class StructureBuilder:
         Returns:
             ASCII-String
         """
-        icon = "🟢" if node.arg_type == "CLAIM" else \
-               "🔵" if node.arg_type == "SUPPORT" else \
-               "🟣" if node.arg_type == "COUNTER" else "⚪"
-        
-        connector = "└── " if is_last else "├── "
-        text = node.text[:60] + "..." if len(node.text) > 60 else node.text
-        current_line = f"{prefix}{connector}{icon} [{node.arg_type}] {text}"
-        
-        lines = [current_line]
-        
-        extension = "    " if is_last else "│   "
-        for i, child in enumerate(node.children):
-            is_last_child = (i == len(node.children) - 1)
-            child_tree = self._build_ascii_tree(child, prefix + extension, is_last_child)
-            lines.append(child_tree)
+        return "\n".join(self._ascii_lines([(node, prefix, is_last)]))
+    
+    def _ascii_lines(self, stack: List[tuple]) -> List[str]:
+        """
+        ASCII-Zeilen iterativ bauen (Tiefensuche mit eigenem Stack)
+        Args:
+            stack: (node, prefix, is_last)-Tupel, oberstes Element zuerst ausgegeben
+        Returns:
+            Liste der Zeilen
+        """
+        lines = []
+        while stack:
+            node, prefix, is_last = stack.pop()
+            icon = _ICONS[node.arg_type]
+            connector = _CONN_LAST if is_last else _CONN_MID
+            text = node.text
+            if len(text) > 60:
+                text = f"{text[:60]}..."
+            lines.append(f"{prefix}{connector}{icon} [{node.arg_type.name}] {text}")
+            
+            # Kinder umgekehrt auf den Stack, damit das erste zuerst ausgegeben wird
+            extension = _EXT_LAST if is_last else _EXT_MID
+            children = node.children
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], prefix + extension, i == last))
         
-        return "\n".join(lines)
+        return lines
 
 
 if __name__ == "__main__":
@@ -262,4 +342,4 @@ if __name__ == "__main__":
     path = builder.get_strongest_path()
     for i, node in enumerate(path):
         indent = "  " * i
-        print(f"{indent}→ {node.arg_type}: {node.text[:50]}... (strength: {node.strength:.2f})")
+        print(f"{indent}→ {node.arg_type.name}: {node.text[:50]}... (strength: {node.strength:.2f})")
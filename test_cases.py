@@ -65,18 +65,21 @@ TEST_CASES = {
 }
 
 
+# Computed once; a tuple, so callers cannot change it
+_AVAILABLE = tuple(TEST_CASES)
+
+
 def get_test_case(name: str) -> str:
     """Get a test case by name"""
-    if name in TEST_CASES:
-        return TEST_CASES[name]
-    else:
-        available = list(TEST_CASES.keys())
-        raise ValueError(f"Unknown test case: {name}. Available: {available}")
+    text = TEST_CASES.get(name)
+    if text is None:
+        raise ValueError(f"Unknown test case: {name}. Available: {list(_AVAILABLE)}")
+    return text
 
 
 def list_test_cases():
     """List all available test cases"""
-    return list(TEST_CASES.keys())
+    return _AVAILABLE
 
 
 if __name__ == "__main__":
@@ -79,6 +79,12 @@ LANGUAGES = {
     },
 }
 
+# Texte ohne Platzhalter je Sprache: werden direkt zurückgegeben, ohne format()
+_STATIC = {
+    lang: {key: template for key, template in strings.items() if "{" not in template and "}" not in template}
+    for lang, strings in LANGUAGES.items()
+}
+
 
 def t(lang: str, key: str, **kwargs) -> str:
     """Return translated string for given language and key.
@@ -86,8 +92,11 @@ def t(lang: str, key: str, **kwargs) -> str:
     Falls der Schlüssel nicht existiert, wird der Schlüssel selbst
     zurückgegeben (nützlich während der Entwicklung).
     """
+    template = _STATIC.get(lang, _STATIC["en"]).get(key)
+    if template is not None:
+        return template
     template = LANGUAGES.get(lang, LANGUAGES["en"]).get(key, key)
     try:
-        return template.format(**kwargs)
+        return template.format_map(kwargs)
     except Exception:
         return template
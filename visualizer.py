@@ -2,25 +2,88 @@
 Visualizer Module: Visualisiert Analyse-Ergebnisse im Terminal
 """
 
-from typing import List, Dict
+import heapq
+import sys
+from functools import wraps
+from typing import List, Dict, Optional, TextIO
 from argument_classification import ArgumentClassification
 from structure_builder import StructureBuilder, ArgumentNode
 from emotion_analysis import EmotionResult
 
 
+# Alle 21 möglichen Bars der Standardbreite 20, indiziert über die Anzahl gefüllter Zellen
+_BAR_WIDTH = 20
+_BARS = tuple("[" + "█" * filled + "░" * (_BAR_WIDTH - filled) + "]" for filled in range(_BAR_WIDTH + 1))
+# Andere Breiten bis _BAR_MAX: Ausschnitt aus einer festen Vorlage
+_BAR_MAX = 100
+_BAR_TEMPLATE = "█" * _BAR_MAX + "░" * _BAR_MAX
+
+_BANNER = "🔬" * 35
+
+
+def _buffered(method):
+    """
+    Sammelt die Ausgabe einer print-Methode und schreibt sie mit einem
+    write; verschachtelte Aufrufe (z.B. in print_full_analysis) schreiben
+    erst, wenn der äußerste fertig ist. Jede print-Methode nimmt dadurch
+    das Keyword stream (Standard: sys.stdout zum Aufrufzeitpunkt); bei
+    verschachtelten Aufrufen gilt der Stream des äußersten.
+    """
+    @wraps(method)
+    def wrapper(self, *args, stream: Optional[TextIO] = None, **kwargs):
+        if self._depth == 0:
+            self._stream = stream if stream is not None else sys.stdout
+        self._depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._flush()
+                self._stream = None
+    return wrapper
+
+
 class TerminalVisualizer:
     """Erstellt hübsche Terminal-Ausgaben der Analyse-Ergebnisse"""
     
+    # Einmal pro Klasse statt pro Aufruf von _get_argument_icon
+    _ICONS = {"CLAIM": "🟢", "SUPPORT": "🔵", "COUNTER": "🟣", "NEUTRAL": "⚪"}
+    _SENT_ICONS = {"positive": "😊", "negative": "😠", "neutral": "😐"}
+    # Reihenfolge der Typen in der Zusammenfassung
+    _ARG_TYPES = ("CLAIM", "SUPPORT", "COUNTER", "NEUTRAL")
+    
     def __init__(self):
         """Initialisiert Visualizer"""
         self.width = 70
+        # Trennlinien einmal pro Visualizer statt bei jedem Header
+        self._sep_eq = "=" * self.width
+        self._sep_dash = "-" * self.width
+        # Gepufferte Ausgabezeilen, Verschachtelungstiefe der print-Methoden
+        # und Ziel-Stream des laufenden äußersten Aufrufs
+        self._buf: List[str] = []
+        self._depth = 0
+        self._stream: Optional[TextIO] = None
+    
+    def _emit(self, text: str = ""):
+        """Puffert eine Ausgabezeile (wie print)"""
+        self._buf.append(text + "\n")
     
+    def _flush(self):
+        """Schreibt den Puffer mit einem write in den Ziel-Stream"""
+        if not self._buf:
+            return
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write("".join(self._buf))
+        self._buf.clear()
+        stream.flush()
+    
+    @_buffered
     def print_header(self, title: str):
         """Druckt schönen Header"""
-        print("\n" + "=" * self.width)
-        print(f"🧠 {title}")
-        print("=" * self.width)
+        self._emit(f"\n{self._sep_eq}\n🧠 {title}\n{self._sep_eq}")
     
+    @_buffered
     def print_argument_analysis(self, classifications: List[ArgumentClassification]):
         """
         Druckt detaillierte Argument-Analyse
@@ -29,34 +92,29 @@ class TerminalVisualizer:
         """
         self.print_header("ARGUMENT ANALYSIS")
         
-        for i, cls in enumerate(classifications, 1):
-            self._print_argument(i, cls)
+        if classifications:
+            self._emit("\n".join(self._format_argument(i, cls) for i, cls in enumerate(classifications, 1)))
     
-    def _print_argument(self, num: int, cls: ArgumentClassification):
-        """Druckt einzelnes Argument"""
-        icon = self._get_argument_icon(cls.argument_type)
-        
-        print(f"\n[{num}] {icon} {cls.argument_type}")
-        print(f"    Text: {cls.sentence_text}")
-        
-        # Confidence Bar
+    def _format_argument(self, num: int, cls: ArgumentClassification) -> str:
+        """Formatiert einzelnes Argument als mehrzeiligen Block (ohne Ausgabe)"""
+        icon = self._ICONS.get(cls.argument_type, "⚪")
         confidence_bar = self._draw_bar(cls.confidence)
-        print(f"    Confidence: {confidence_bar} {cls.confidence:.0%}")
-        
-        # Strength
         strength_bar = self._draw_bar(cls.strength)
-        print(f"    Strength:   {strength_bar} {cls.strength:.0%}")
-        
-        # Emotionality
         emotion_bar = self._draw_bar(cls.emotionality)
-        emotion_icon = "😊" if cls.sentiment == "positive" else "😠" if cls.sentiment == "negative" else "😐"
-        print(f"    Emotion:    {emotion_bar} {cls.emotionality:.0%} {emotion_icon} {cls.sentiment}")
+        emotion_icon = self._SENT_ICONS.get(cls.sentiment, "😐")
         
-        # Keywords
+        block = (
+            f"\n[{num}] {icon} {cls.argument_type}\n"
+            f"    Text: {cls.sentence_text}\n"
+            f"    Confidence: {confidence_bar} {cls.confidence:.0%}\n"
+            f"    Strength:   {strength_bar} {cls.strength:.0%}\n"
+            f"    Emotion:    {emotion_bar} {cls.emotionality:.0%} {emotion_icon} {cls.sentiment}"
+        )
         if cls.keywords:
-            keywords_str = ", ".join(cls.keywords[:5])
-            print(f"    Keywords:   {keywords_str}")
+            block += f"\n    Keywords:   {', '.join(cls.keywords[:5])}"
+        return block
     
+    @_buffered
     def print_argument_summary(self, summary: Dict):
         """
         Druckt Zusammenfassung der Argument-Typen
@@ -65,24 +123,26 @@ class TerminalVisualizer:
         """
         self.print_header("ARGUMENT SUMMARY")
         
-        for arg_type in ["CLAIM", "SUPPORT", "COUNTER", "NEUTRAL"]:
+        get_icon = self._ICONS.get
+        for arg_type in self._ARG_TYPES:
             if arg_type in summary:
                 stats = summary[arg_type]
                 count = stats["count"]
                 avg_strength = stats["avg_strength"]
                 
-                icon = self._get_argument_icon(arg_type)
+                icon = get_icon(arg_type, "⚪")
                 bar = self._draw_bar(avg_strength)
                 
-                print(f"\n{icon} {arg_type}")
-                print(f"    Count:       {count}")
-                print(f"    Avg Strength: {bar} {avg_strength:.0%}")
-                
+                block = (
+                    f"\n{icon} {arg_type}\n"
+                    f"    Count:       {count}\n"
+                    f"    Avg Strength: {bar} {avg_strength:.0%}"
+                )
                 if stats["examples"]:
-                    print(f"    Examples:")
-                    for example in stats["examples"]:
-                        print(f"      • {example}")
+                    block += "\n    Examples:" + "".join(f"\n      • {example}" for example in stats["examples"])
+                self._emit(block)
     
+    @_buffered
     def print_structure(self, builder: StructureBuilder):
         """
         Druckt Argument-Struktur (ASCII-Baum)
@@ -91,16 +151,19 @@ class TerminalVisualizer:
         """
         self.print_header("ARGUMENT STRUCTURE")
         
-        tree_visualization = builder.visualize_ascii()
-        print(tree_visualization)
+        # Ohne Root-Claims ist der Baum leer: Leerzeile wie bisher, ohne ihn zu bauen
+        stats = builder.get_tree_stats()
+        self._emit(builder.visualize_ascii() if stats["num_root_claims"] else "")
         
         # Statistiken
-        print("\n" + "-" * self.width)
-        stats = builder.get_tree_stats()
-        print(f"📊 Total Nodes: {stats['total_nodes']} | Depth: {stats['max_depth']}")
-        print(f"   Claims: {stats['total_claims']} | Supports: {stats['total_supports']} | Counters: {stats['total_counters']}")
-        print(f"   Avg Strength: {stats['avg_strength']:.2f}")
+        self._emit(f"\n{self._sep_dash}")
+        self._emit(
+            f"📊 Total Nodes: {stats['total_nodes']} | Depth: {stats['max_depth']}\n"
+            f"   Claims: {stats['total_claims']} | Supports: {stats['total_supports']} | Counters: {stats['total_counters']}\n"
+            f"   Avg Strength: {stats['avg_strength']:.2f}"
+        )
     
+    @_buffered
     def print_strongest_arguments(self, classifications: List[ArgumentClassification], top_n: int = 3):
         """
         Druckt stärkste Argumente
@@ -108,17 +171,21 @@ class TerminalVisualizer:
             classifications: Klassifikations-Liste
             top_n: Wie viele zeigen
         """
+        # Wie sorted(..., reverse=True)[:top_n], aber ohne die ganze Liste zu sortieren
+        self._emit_strongest(heapq.nlargest(top_n, classifications, key=lambda c: c.strength), top_n)
+    
+    def _emit_strongest(self, sorted_args: List[ArgumentClassification], top_n: int):
+        """Puffert den Abschnitt der stärksten Argumente (bereits absteigend sortiert)"""
         self.print_header(f"TOP {top_n} STRONGEST ARGUMENTS")
         
-        sorted_args = sorted(classifications, key=lambda c: c.strength, reverse=True)[:top_n]
-        
+        get_icon = self._ICONS.get
         for i, cls in enumerate(sorted_args, 1):
-            icon = self._get_argument_icon(cls.argument_type)
+            icon = get_icon(cls.argument_type, "⚪")
             bar = self._draw_bar(cls.strength)
             
-            print(f"\n#{i} {icon} {cls.argument_type} - Strength: {bar} {cls.strength:.0%}")
-            print(f"    {cls.sentence_text}")
+            self._emit(f"\n#{i} {icon} {cls.argument_type} - Strength: {bar} {cls.strength:.0%}\n    {cls.sentence_text}")
     
+    @_buffered
     def print_emotional_analysis(self, emotion_results: List[EmotionResult], summary: Dict):
         """
         Druckt emotionale Analyse
@@ -129,49 +196,78 @@ class TerminalVisualizer:
         self.print_header("EMOTIONAL ANALYSIS")
         
         # Overall Summary
-        print(f"\n📊 Overall Sentiment:")
-        print(f"    Positive: {summary['positive']} sentences")
-        print(f"    Negative: {summary['negative']} sentences")
-        print(f"    Neutral:  {summary['neutral']} sentences")
-        
         sentiment_score = summary['avg_sentiment']
         sentiment_bar = self._draw_bar((sentiment_score + 1) / 2)  # Normalisiert zu 0-1
-        print(f"    Avg Score: {sentiment_bar} {sentiment_score:+.2f}")
-        
-        print(f"\n😤 Average Emotionality: {summary['avg_emotionality']:.2f}")
         emotionality_bar = self._draw_bar(summary['avg_emotionality'])
-        print(f"    {emotionality_bar}")
+        self._emit(
+            f"\n📊 Overall Sentiment:\n"
+            f"    Positive: {summary['positive']} sentences\n"
+            f"    Negative: {summary['negative']} sentences\n"
+            f"    Neutral:  {summary['neutral']} sentences\n"
+            f"    Avg Score: {sentiment_bar} {sentiment_score:+.2f}\n"
+            f"\n😤 Average Emotionality: {summary['avg_emotionality']:.2f}\n"
+            f"    {emotionality_bar}"
+        )
         
-        # Sehr emotionale Sätze
-        emotional_sentences = [r for r in emotion_results if r.emotionality > 0.6]
-        if emotional_sentences:
-            print(f"\n🔥 Highly Emotional Sentences ({len(emotional_sentences)}):")
-            for r in emotional_sentences[:3]:
-                print(f"    • {r.sentence_text}")
+        # Sehr emotionale Sätze: zählen, aber nur die ersten 3 aufheben
+        count = 0
+        examples = []
+        for r in emotion_results:
+            if r.emotionality > 0.6:
+                count += 1
+                if count <= 3:
+                    examples.append(f"\n    • {r.sentence_text}")
+        if count:
+            self._emit(f"\n🔥 Highly Emotional Sentences ({count}):" + "".join(examples))
     
+    @_buffered
     def print_logical_weaknesses(self, classifications: List[ArgumentClassification], detector_func):
         """
-        Druckt logische Schwächen
+        Druckt logische Schwächen (höchstens 5 Sätze)
         Args:
             classifications: Klassifikations-Liste
-            detector_func: Funktion(classification) -> List[str]
+            detector_func: Funktion(classification) -> Liste von Weakness-Dicts
+                (wie ArgumentClassifier.detect_logical_weaknesses) oder Strings
         """
-        self.print_header("LOGICAL WEAKNESSES & FALLACIES")
-        
+        # Nur so viele Sätze prüfen, bis 5 mit Schwächen gefunden sind
         found_weaknesses = {}
         for cls in classifications:
-            weaknesses = detector_func(cls)
-            if any("⚠️" in w or "🔴" in w for w in weaknesses):
-                found_weaknesses[cls.sentence_text] = weaknesses
+            self._collect_weaknesses(found_weaknesses, cls, detector_func)
+            if len(found_weaknesses) == 5:
+                break
+        self._emit_weaknesses(found_weaknesses)
+    
+    def _collect_weaknesses(self, found_weaknesses: Dict, cls: ArgumentClassification, detector_func):
+        """Trägt die Schwächen von cls nach Satztext ein, falls es echte gibt"""
+        weaknesses = detector_func(cls)
+        if any(self._is_weakness(w) for w in weaknesses):
+            found_weaknesses[cls.sentence_text] = weaknesses
+    
+    def _emit_weaknesses(self, found_weaknesses: Dict):
+        """Puffert den Abschnitt der logischen Schwächen"""
+        self.print_header("LOGICAL WEAKNESSES & FALLACIES")
         
         if found_weaknesses:
-            for text, weaknesses in list(found_weaknesses.items())[:5]:
-                print(f"\n❌ {text}")
-                for weakness in weaknesses:
-                    print(f"    {weakness}")
+            for text, weaknesses in found_weaknesses.items():
+                self._emit(f"\n❌ {text}" + "".join(f"\n    {self._format_weakness(w)}" for w in weaknesses))
         else:
-            print("\n✅ No major logical weaknesses detected!")
+            self._emit("\n✅ No major logical weaknesses detected!")
+    
+    @staticmethod
+    def _is_weakness(weakness) -> bool:
+        """Echte Schwäche? Dicts: alles außer dem "None"-Eintrag; Strings: mit Warn-Icon"""
+        if isinstance(weakness, dict):
+            return weakness.get("name", "None") != "None"
+        return "⚠️" in weakness or "🔴" in weakness
+    
+    @staticmethod
+    def _format_weakness(weakness) -> str:
+        """Eine Ausgabezeile pro Schwäche"""
+        if isinstance(weakness, dict):
+            return f"🔴 {weakness['name']}: {weakness['description']}"
+        return weakness
     
+    @_buffered
     def print_full_analysis(self, classifications: List[ArgumentClassification], 
                            builder: StructureBuilder, emotion_results: List[EmotionResult],
                            summary_dict: Dict, emotion_summary: Dict, detector_func):
@@ -184,36 +280,57 @@ class TerminalVisualizer:
             summary_dict: Argument-Summary
             emotion_summary: Emotions-Summary
             detector_func: Weakness-Detector-Funktion
+            stream: (Keyword) Ziel der Ausgabe, Standard sys.stdout
         """
-        print("\n" + "🔬" * 35)
-        print("🧠 ARGUMENT STRUCTURE ANALYZER - FULL ANALYSIS 🧠")
-        print("🔬" * 35)
+        self._emit(f"\n{_BANNER}\n🧠 ARGUMENT STRUCTURE ANALYZER - FULL ANALYSIS 🧠\n{_BANNER}")
         
-        self.print_argument_analysis(classifications)
+        # Argument-Analyse, Schwächen und Top 3 in einem Durchlauf
+        found_weaknesses, strongest = self._argument_pass(classifications, detector_func, top_n=3)
         self.print_argument_summary(summary_dict)
         self.print_structure(builder)
         self.print_emotional_analysis(emotion_results, emotion_summary)
-        self.print_logical_weaknesses(classifications, detector_func)
-        self.print_strongest_arguments(classifications, top_n=3)
+        self._emit_weaknesses(found_weaknesses)
+        self._emit_strongest(strongest, 3)
         
         self.print_footer()
     
+    def _argument_pass(self, classifications: List[ArgumentClassification], detector_func, top_n: int):
+        """
+        Puffert die Argument-Analyse und sammelt im selben Durchlauf die
+        Schwächen (wie print_logical_weaknesses) und die top_n stärksten
+        Argumente (wie print_strongest_arguments)
+        Returns:
+            (found_weaknesses, strongest)
+        """
+        self.print_header("ARGUMENT ANALYSIS")
+        
+        blocks = []
+        found_weaknesses = {}
+        heap = []  # Min-Heap aus (strength, -index, cls)
+        for i, cls in enumerate(classifications, 1):
+            blocks.append(self._format_argument(i, cls))
+            if len(found_weaknesses) < 5:
+                self._collect_weaknesses(found_weaknesses, cls, detector_func)
+            # -index: bei gleicher Stärke gewinnt das frühere Argument, wie bei nlargest
+            if len(heap) < top_n:
+                heapq.heappush(heap, (cls.strength, -i, cls))
+            elif (cls.strength, -i) > heap[0][:2]:
+                heapq.heapreplace(heap, (cls.strength, -i, cls))
+        
+        if blocks:
+            self._emit("\n".join(blocks))
+        strongest = [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+        return found_weaknesses, strongest
+    
+    @_buffered
     def print_footer(self):
         """Druckt schönen Footer"""
-        print("\n" + "=" * self.width)
-        print("✨ Analysis complete! Use this structure to understand argument flow.")
-        print("=" * self.width + "\n")
+        self._emit(f"\n{self._sep_eq}\n✨ Analysis complete! Use this structure to understand argument flow.\n{self._sep_eq}\n")
     
-    @staticmethod
-    def _get_argument_icon(arg_type: str) -> str:
+    @classmethod
+    def _get_argument_icon(cls, arg_type: str) -> str:
         """Gibt Icon für Argument-Typ"""
-        icons = {
-            "CLAIM": "🟢",
-            "SUPPORT": "🔵",
-            "COUNTER": "🟣",
-            "NEUTRAL": "⚪"
-        }
-        return icons.get(arg_type, "⚪")
+        return cls._ICONS.get(arg_type, "⚪")
     
     @staticmethod
     def _draw_bar(value: float, width: int = 20) -> str:
@@ -226,6 +343,11 @@ class TerminalVisualizer:
             Bar-String
         """
         filled = int(value * width)
+        if 0 <= filled <= width:
+            if width == _BAR_WIDTH:
+                return _BARS[filled]
+            if width <= _BAR_MAX:
+                return f"[{_BAR_TEMPLATE[_BAR_MAX - filled:_BAR_MAX - filled + width]}]"
         empty = width - filled
         return "[" + "█" * filled + "░" * empty + "]"
 